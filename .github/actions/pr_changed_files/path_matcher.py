@@ -0,0 +1,47 @@
+"""Match repository paths against fnmatch patterns, one path component at a time, with a single regex."""
+import re
+from pathlib import PurePosixPath
+
+
+def translate(part):
+    """Translate one fnmatch path component to a regex that never matches across '/'."""
+    res = []
+    i = 0
+    while i < len(part):
+        c = part[i]
+        i += 1
+        if c == "*":
+            res.append("[^/]*")
+        elif c == "?":
+            res.append("[^/]")
+        elif c == "[":
+            # As in fnmatch, a ']' right after '[' or '[!' is part of the set
+            j = i
+            if part[j:j + 1] == "!":
+                j += 1
+            if part[j:j + 1] == "]":
+                j += 1
+            j = part.find("]", j)
+            if j == -1:
+                res.append(re.escape(c))
+                continue
+            stuff = part[i:j].replace("\\", "\\\\")
+            if stuff.startswith("!"):
+                stuff = "^" + stuff[1:]
+            elif stuff.startswith("^"):
+                stuff = "\\" + stuff
+            # The components are joined with '/': neither a negated set nor a range such as '+-0' may match it
+            res.append(f"(?!/)[{stuff}]" if stuff.startswith("^") or "-" in stuff else f"[{stuff}]")
+            i = j + 1
+        else:
+            res.append(re.escape(c))
+    return "".join(res)
+
+
+def compile_patterns(patterns):
+    """
+    Compile all patterns into a single regex matching '/' separated paths. A pattern only matches paths
+    with the same number of components, as when comparing each component with fnmatch.
+    """
+    alternatives = ("/".join(translate(part) for part in PurePosixPath(pattern).parts) for pattern in patterns)
+    return re.compile("|".join(f"(?:{alternative})" for alternative in alternatives) or "(?!)")
@@ -0,0 +1,72 @@
+"""Tests of the path matcher of the pr_changed_files action.
+
+Run with `python -m pytest .github/actions/pr_changed_files` from the root of the repository.
+"""
+import fnmatch
+import itertools
+import os
+import re
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from path_matcher import compile_patterns, translate  # noqa: E402
+
+
+class TranslateTest(unittest.TestCase):
+    CASES = [
+        ("*.py", "conanfile.py", True),
+        ("*.py", "dir/conanfile.py", False),
+        ("?", "/", False),
+        ("[!x]", "y", True),
+        ("[!x]", "x", False),
+        ("[!x]", "/", False),
+        ("a[!x]b", "a/b", False),
+        ("[]x]", "]", True),
+        ("[!]x]", "]", False),
+        ("[!]x]", "a", True),
+        ("[!]]", "/", False),
+        ("[+-0]", "/", False),
+        ("[+-0]", "-", True),
+        ("[^x]", "^", True),
+        ("[", "[", True),
+        ("[!", "[!", True),
+    ]
+
+    def test_cases(self):
+        for pattern, name, expected in self.CASES:
+            with self.subTest(pattern=pattern, name=name):
+                self.assertIs(bool(re.fullmatch(translate(pattern), name)), expected, translate(pattern))
+
+    def test_same_as_fnmatch_without_separator(self):
+        # Every pattern of up to 4 characters against every name of up to 3 characters: same result as
+        # fnmatch, except that a name containing '/' never matches
+        alphabet = "ax]!^-/+0"
+        names = ["".join(n) for length in range(4) for n in itertools.product(alphabet, repeat=length)]
+        for length in range(1, 5):
+            for pattern in map("".join, itertools.product(alphabet.replace("/", ""), repeat=length)):
+                regex = re.compile(translate(pattern))
+                for name in names:
+                    expected = "/" not in name and fnmatch.fnmatchcase(name, pattern)
+                    if bool(regex.fullmatch(name)) is not expected:
+                        self.fail(f"{pattern!r} against {name!r}: expected {expected}, regex {regex.pattern!r}")
+
+
+class CompilePatternsTest(unittest.TestCase):
+    def test_component_count(self):
+        matcher = compile_patterns(["recipes/*/all/*.py", "recipes/[!b]*/config.yml"])
+        self.assertTrue(matcher.fullmatch("recipes/zlib/all/conanfile.py"))
+        self.assertTrue(matcher.fullmatch("recipes/zlib/config.yml"))
+        self.assertFalse(matcher.fullmatch("recipes/boost/config.yml"))
+        self.assertFalse(matcher.fullmatch("recipes/zlib/all/test_package/conanfile.py"))
+        self.assertFalse(matcher.fullmatch("recipes/a/b/config.yml"))
+
+    def test_no_patterns_match_nothing(self):
+        matcher = compile_patterns([])
+        self.assertFalse(matcher.fullmatch(""))
+        self.assertFalse(matcher.fullmatch("recipes/zlib/config.yml"))
+
+
+if __name__ == "__main__":
+    unittest.main()
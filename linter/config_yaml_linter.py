@@ -1,6 +1,11 @@
 import argparse
 from strictyaml import load, Map, Str, YAMLValidationError, MapPattern
-from yaml_linting import file_path
+from yaml_linting import add_batch_arguments, expand_paths, make_cache, run_batch
+
+
+schema = Map(
+    {"versions": MapPattern(Str(), Map({"folder": Str()}), minimum_keys=1)}
+)
 
 
 def main():
@@ -8,29 +13,37 @@ def main():
         description="Validate ConanCenterIndex's 'config.yaml' file."
     )
     parser.add_argument(
-        "path",
-        nargs="?",
-        type=file_path,
-        help="file to validate.",
+        "paths",
+        nargs="*",
+        metavar="path",
+        help="files to validate. Directories are searched recursively for 'config.yml' files "
+             "and glob patterns (e.g. 'recipes/*/config.yml') are expanded.",
     )
+    add_batch_arguments(parser)
     args = parser.parse_args()
 
-    schema = Map(
-        {"versions": MapPattern(Str(), Map({"folder": Str()}), minimum_keys=1)}
-    )
+    try:
+        paths = expand_paths(args.paths, "config.yml")
+    except argparse.ArgumentTypeError as error:
+        parser.error(str(error))
+    run_batch(lint_file, paths, jobs=args.jobs, summary=args.summary, cache=make_cache(args, __file__))
+
 
-    with open(args.path) as f:
+def lint_file(path):
+    """Validate a single 'config.yml' and return the GitHub annotations for it."""
+    with open(path) as f:
         content = f.read()
 
     try:
         load(content, schema)
     except YAMLValidationError as error:
         e = error.__str__().replace("\n", "%0A")
-        print(
-            f"::error file={args.path},line={error.context_mark.line},endline={error.problem_mark.line},"
+        return [
+            f"::error file={path},line={error.context_mark.line},endline={error.problem_mark.line},"
             f"title=config.yml schema error"
             f"::{e}\n"
-        )
+        ]
+    return []
 
 
 if __name__ == "__main__":
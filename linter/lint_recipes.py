@@ -0,0 +1,229 @@
+import argparse
+import os
+import re
+import subprocess
+import sys
+import time
+
+from yaml_linting import ResultCache, linter_version
+
+LINTER_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(LINTER_DIR)
+RCFILES = {
+    "recipe": os.path.join(LINTER_DIR, "pylintrc_recipe"),
+    "testpackage": os.path.join(LINTER_DIR, "pylintrc_testpackage"),
+}
+# Same layout as the annotations matched by recipe_linter.json
+MSG_TEMPLATE = "{path}:{line}: [{msg_id}({symbol}), {obj}] {msg}"
+_message = re.compile(r"(\S+):(\d+): \[([A-Z])\d+\(")
+
+
+def rcfile_kind(path):
+    """`testpackage` for the conanfile.py of a test_package or test_v1_package folder, else `recipe`."""
+    parts = os.path.normpath(path).split(os.sep)
+    return "testpackage" if any(p.startswith("test_") and p.endswith("package") for p in parts[:-1]) else "recipe"
+
+
+def _recipe_folder(path):
+    """`recipes/<name>/<folder>` containing `path`, or None."""
+    parts = os.path.normpath(path).split(os.sep)
+    if len(parts) >= 4 and parts[0] == "recipes":
+        return os.path.join(*parts[:3])
+    return None
+
+
+def conanfiles_in(folder):
+    """The recipe and test package conanfile.py files of a recipe folder."""
+    found = []
+    for dirpath, dirnames, filenames in os.walk(folder):
+        dirnames[:] = sorted(d for d in dirnames if dirpath == folder and d.startswith("test_"))
+        if "conanfile.py" in filenames:
+            found.append(os.path.join(dirpath, "conanfile.py"))
+    return found
+
+
+def helper_modules(conanfile):
+    """Python modules next to a recipe that it may import, which affect its lint results."""
+    folder = os.path.dirname(conanfile)
+    return sorted(os.path.join(folder, f) for f in os.listdir(folder)
+                  if f.endswith(".py") and f != "conanfile.py")
+
+
+def _git(*args):
+    return subprocess.run(["git", "-C", ROOT_DIR, *args], check=True, capture_output=True, text=True).stdout
+
+
+def changed_conanfiles(base):
+    """conanfile.py files changed since the merge base of `base` and HEAD, including uncommitted changes.
+
+    A change to any other Python file of a recipe folder (e.g. a shared helpers.py) selects all
+    the conanfile.py files of that folder.
+    """
+    merge_base = _git("merge-base", base, "HEAD").strip()
+    changed = _git("diff", "--name-only", "--no-renames", "--diff-filter=d", merge_base, "--", "recipes").splitlines()
+    changed += _git("ls-files", "--others", "--exclude-standard", "--", "recipes").splitlines()
+    selected = set()
+    for path in changed:
+        if not path.endswith(".py") or not os.path.isfile(os.path.join(ROOT_DIR, path)):
+            continue
+        if os.path.basename(path) == "conanfile.py":
+            selected.add(path)
+        else:
+            folder = _recipe_folder(path)
+            if folder:
+                selected.update(os.path.relpath(p, ROOT_DIR) for p in conanfiles_in(os.path.join(ROOT_DIR, folder)))
+    return sorted(selected)
+
+
+def expand_conanfiles(paths):
+    files = set()
+    for path in paths:
+        if os.path.isdir(path):
+            for dirpath, dirnames, filenames in os.walk(path):
+                dirnames.sort()
+                if "conanfile.py" in filenames:
+                    files.add(os.path.join(dirpath, "conanfile.py"))
+        else:
+            files.add(path)
+    return sorted(os.path.relpath(os.path.abspath(f), ROOT_DIR) for f in files)
+
+
+class PylintError(Exception):
+    """pylint crashed or stopped before linting all the files, its results are incomplete."""
+
+    def __init__(self, message, results):
+        super().__init__(message)
+        self.results = results
+
+
+def run_pylint(rcfile, paths, jobs):
+    """Lint `paths` in one pylint process and return the output lines of each path.
+
+    Raises PylintError when pylint did not lint the files, e.g. on a crash or a fatal error.
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [ROOT_DIR, env.get("PYTHONPATH")]))
+    # duplicate-code compares files with each other, its result for one file can not be cached
+    command = [sys.executable, "-m", "pylint", f"--rcfile={rcfile}", f"--jobs={jobs}", "--disable=duplicate-code",
+               "--output-format=text", f"--msg-template={MSG_TEMPLATE}", *paths]
+    output = subprocess.run(command, cwd=ROOT_DIR, env=env, capture_output=True, text=True)
+    results = {path: [] for path in paths}
+    current = None
+    for line in output.stdout.splitlines():
+        m = _message.match(line)
+        if m and m.group(1) in results:
+            current = m.group(1)
+            results[current].append(line)
+        elif line.startswith("*************"):
+            current = None
+        elif current and line.strip():
+            # Continuation of a multi-line message
+            results[current][-1] += "\n" + line
+    # Bit 1 is a fatal message or a crash with a traceback (exit code 1), bit 32 a usage error.
+    # A failure without any message also means that pylint died, e.g. killed by a signal.
+    if output.returncode & 33 or output.returncode < 0 or (output.returncode and not any(results.values())):
+        raise PylintError(f"pylint exited with code {output.returncode}:\n"
+                          f"{(output.stderr or output.stdout).strip()}", results)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Run pylint with the ConanCenterIndex rcfiles over recipes, using "
+                    "pylintrc_testpackage for test packages and pylintrc_recipe for the rest."
+    )
+    parser.add_argument(
+        "paths",
+        nargs="*",
+        metavar="path",
+        help="conanfile.py files to lint. Directories are searched recursively for conanfile.py files.",
+    )
+    parser.add_argument(
+        "--base",
+        metavar="REF",
+        help="lint the conanfile.py files changed since the merge base of REF and HEAD, uncommitted "
+             "changes included, and all the ones of a recipe folder if one of its helper modules changed.",
+    )
+    parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=0,
+        help="passed to pylint --jobs, 0 for one process per CPU (default: %(default)s).",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        help="directory used to cache results of unchanged files between runs (disabled by default).",
+    )
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=64,
+        help="maximum size of the result cache in MiB, least recently used entries are evicted first.",
+    )
+    parser.add_argument(
+        "--summary",
+        action="store_true",
+        help="print the number of linted and cached files to stderr.",
+    )
+    args = parser.parse_args()
+
+    if args.base:
+        paths = changed_conanfiles(args.base) + expand_conanfiles(args.paths)
+    elif args.paths:
+        paths = expand_conanfiles(args.paths)
+    else:
+        parser.error("give paths to lint or --base")
+    paths = sorted(set(paths))
+
+    start = time.perf_counter()
+    plugins = sorted(os.path.join(LINTER_DIR, f) for f in os.listdir(LINTER_DIR) if f.endswith(".py"))
+    results = {}
+    hits = 0
+    crashed = False
+    for kind, rcfile in RCFILES.items():
+        kind_paths = [p for p in paths if rcfile_kind(p) == kind]
+        if not kind_paths:
+            continue
+        cache = keys = None
+        if args.cache_dir:
+            # Results depend on the rcfile, the plugins and the pylint and astroid versions
+            version = linter_version(rcfile, *plugins, packages=("pylint", "astroid", "conan"))
+            cache = ResultCache(args.cache_dir, version, max_size=args.cache_size * 1024 * 1024)
+            keys = {}
+            for path in kind_paths:
+                absolute = os.path.join(ROOT_DIR, path)
+                keys[path] = cache.key(absolute, *helper_modules(absolute))
+                annotations = cache.get(keys[path])
+                if annotations is not None:
+                    results[path] = annotations
+            hits += cache.hits
+        pending = [p for p in kind_paths if p not in results]
+        if pending:
+            try:
+                linted = run_pylint(rcfile, pending, args.jobs)
+            except PylintError as e:
+                # Nothing of this batch is cached, so it is linted again on the next run
+                print(e, file=sys.stderr)
+                crashed = True
+                results.update(e.results)
+            else:
+                results.update(linted)
+                if cache:
+                    for path, annotations in linted.items():
+                        cache.put(keys[path], annotations)
+        if cache:
+            cache.evict()
+
+    failed = False
+    for path in paths:
+        for annotation in results[path]:
+            print(annotation)
+            failed = failed or _message.match(annotation).group(3) in ("E", "F")
+
+    if args.summary:
+        print(f"Linted {len(paths)} files in {time.perf_counter() - start:.2f}s ({hits} from the cache)", file=sys.stderr)
+    sys.exit(1 if failed or crashed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,12 +2,17 @@
 # Class ConanFile doesn't declare all the valid members and functions,
 #   some are injected by Conan dynamically to the class.
 
+import functools
 import textwrap
 import astroid
 from astroid.builder import AstroidBuilder
 from astroid.manager import AstroidManager
 
 
+# The classes below are resolved once per process and shared by all the ConanFile classes the
+# transform is applied to. Under `pylint -j N` each worker process builds its own copy.
+
+@functools.lru_cache(maxsize=None)
 def _settings_transform():
     module = AstroidBuilder(AstroidManager()).string_build(
         textwrap.dedent("""
@@ -20,6 +25,7 @@ def _settings_transform():
     )
     return module['Settings']
 
+@functools.lru_cache(maxsize=None)
 def _user_info_build_transform():
     module = AstroidBuilder(AstroidManager()).string_build(
         textwrap.dedent("""
@@ -33,23 +39,22 @@ def _user_info_build_transform():
 def register(_):
     pass
 
-def transform_conanfile(node):
-    """Transform definition of ConanFile class so dynamic fields are visible to pylint"""
+@functools.lru_cache(maxsize=None)
+def _module_lookup(module_name, name):
+    return astroid.MANAGER.ast_from_module_name(module_name).lookup(name)
 
+
+@functools.lru_cache(maxsize=None)
+def _dynamic_fields():
     str_class = astroid.builtin_lookup("str")
     dict_class = astroid.builtin_lookup("dict")
-    info_class = astroid.MANAGER.ast_from_module_name("conans.model.info").lookup(
-        "ConanInfo")
-    build_requires_class = astroid.MANAGER.ast_from_module_name(
-        "conans.client.graph.graph_manager").lookup("_RecipeBuildRequires")
-    file_copier_class = astroid.MANAGER.ast_from_module_name(
-        "conans.client.file_copier").lookup("FileCopier")
-    file_importer_class = astroid.MANAGER.ast_from_module_name(
-        "conans.client.importer").lookup("_FileImporter")
-    python_requires_class = astroid.MANAGER.ast_from_module_name(
-        "conans.client.graph.python_requires").lookup("PyRequires")
-
-    dynamic_fields = {
+    info_class = _module_lookup("conans.model.info", "ConanInfo")
+    build_requires_class = _module_lookup("conans.client.graph.graph_manager", "_RecipeBuildRequires")
+    file_copier_class = _module_lookup("conans.client.file_copier", "FileCopier")
+    file_importer_class = _module_lookup("conans.client.importer", "_FileImporter")
+    python_requires_class = _module_lookup("conans.client.graph.python_requires", "PyRequires")
+
+    return {
         "conan_data": str_class,
         "build_requires": build_requires_class,
         "test_requires" : build_requires_class,
@@ -65,8 +70,11 @@ def transform_conanfile(node):
         "settings_target": [_settings_transform()],
         "conf": dict_class,
     }
-    
-    for f, t in dynamic_fields.items():
+
+
+def transform_conanfile(node):
+    """Transform definition of ConanFile class so dynamic fields are visible to pylint"""
+    for f, t in _dynamic_fields().items():
         node.locals[f] = [i for i in t]
 
 
@@ -9,13 +9,20 @@ we are modifying the messages to point users in the right direction.
 """
 
 
+_V2_LINTER_HINT = ". Please, check https://github.com/conan-io/conan-center-index/blob/master/docs/v2_linter.md"
+
+
 def register(linter: PyLinter):
+    # `pylint -j N` registers the plugins again in every worker, with a copy of the
+    # already modified messages: only add the hint once
     msge1101 = linter.msgs_store._messages_definitions["E1101"]
-    msge1101.msg += ". Please, check https://github.com/conan-io/conan-center-index/blob/master/docs/v2_linter.md"
+    if not msge1101.msg.endswith(_V2_LINTER_HINT):
+        msge1101.msg += _V2_LINTER_HINT
     linter.msgs_store.register_message(msge1101)
 
     msge0611 = linter.msgs_store._messages_definitions["E0611"]
-    msge0611.msg += ". Please, check https://github.com/conan-io/conan-center-index/blob/master/docs/v2_linter.md"
+    if not msge0611.msg.endswith(_V2_LINTER_HINT):
+        msge0611.msg += _V2_LINTER_HINT
     linter.msgs_store.register_message(msge0611)
 
 def transform_tools(module):
@@ -1,4 +1,11 @@
 import argparse
+import glob
+import hashlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
 
 
 def file_path(a_string):
@@ -7,3 +14,185 @@ def file_path(a_string):
     if not isfile(a_string):
         raise argparse.ArgumentTypeError(f"{a_string} does not point to a file")
     return a_string
+
+
+def expand_paths(paths, filename):
+    """Expand files, directories and glob patterns into a sorted list of files.
+
+    Directories are searched recursively for files named `filename`.
+    """
+    files = set()
+    for path in paths:
+        if os.path.isdir(path):
+            files.update(glob.glob(os.path.join(path, "**", filename), recursive=True))
+        elif glob.has_magic(path):
+            files.update(f for f in glob.glob(path, recursive=True) if os.path.isfile(f))
+        else:
+            files.add(file_path(path))
+    return sorted(files)
+
+
+def add_batch_arguments(parser):
+    parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=1,
+        help="number of worker processes to use when validating several files (0 means one per CPU).",
+    )
+    parser.add_argument(
+        "--summary",
+        action="store_true",
+        help="print a throughput summary to stderr once all files are validated.",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        help="directory used to cache results of unchanged files between runs (disabled by default).",
+    )
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=64,
+        help="maximum size of the result cache in MiB, least recently used entries are evicted first.",
+    )
+
+
+def make_cache(args, linter_file):
+    """Create the result cache requested on the command line, if any."""
+    if not args.cache_dir:
+        return None
+    return ResultCache(args.cache_dir, linter_version(linter_file, __file__), max_size=args.cache_size * 1024 * 1024)
+
+
+def _timed(lint_file, path):
+    start = time.perf_counter()
+    annotations = lint_file(path)
+    return path, annotations, time.perf_counter() - start
+
+
+def run_batch(lint_file, paths, jobs=1, summary=False, slowest=5, cache=None):
+    """Run `lint_file` over every path and print the annotations it returns.
+
+    `lint_file` must be a module-level function taking a path and returning a list of
+    annotation lines, so it can be dispatched to worker processes. Annotations are printed
+    in the order of `paths` regardless of completion order. When a `ResultCache` is given,
+    files whose content did not change are replayed from it instead of being validated.
+    """
+    start = time.perf_counter()
+    results = {}
+    keys = {}
+    if cache:
+        for path in paths:
+            keys[path] = cache.key(path)
+            annotations = cache.get(keys[path])
+            if annotations is not None:
+                results[path] = (path, annotations, 0.0)
+    pending = [path for path in paths if path not in results]
+
+    if jobs == 1 or len(pending) < 2:
+        linted = [_timed(lint_file, path) for path in pending]
+    else:
+        workers = jobs or os.cpu_count() or 1
+        chunksize = max(1, len(pending) // (4 * workers))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            linted = list(executor.map(_timed, [lint_file] * len(pending), pending, chunksize=chunksize))
+    for result in linted:
+        results[result[0]] = result
+    if cache:
+        for path, annotations, _ in linted:
+            cache.put(keys[path], annotations)
+        cache.evict()
+    results = [results[path] for path in paths]
+    elapsed = time.perf_counter() - start
+
+    for _, annotations, _ in results:
+        for annotation in annotations:
+            print(annotation)
+
+    if summary:
+        rate = len(results) / elapsed if elapsed else float("inf")
+        print(f"Validated {len(results)} files in {elapsed:.2f}s ({rate:.1f} files/s)", file=sys.stderr)
+        if cache:
+            print(f"  cache: {cache.hits} hits, {cache.misses} misses", file=sys.stderr)
+        for path, _, duration in sorted(linted, key=lambda r: r[2], reverse=True)[:slowest]:
+            print(f"  {duration * 1000:8.1f} ms  {path}", file=sys.stderr)
+    return results
+
+
+class ResultCache:
+    """On-disk cache of linter annotations keyed on file content.
+
+    Each entry is a small JSON file named after the sha256 of the linter version, the file
+    path and the file content, so a changed file, a moved file or a changed linter all miss.
+    Hits refresh the entry's mtime, and once the cache grows beyond `max_size` bytes the
+    least recently used entries are evicted.
+    """
+
+    def __init__(self, directory, version, max_size=64 * 1024 * 1024):
+        self.directory = directory
+        self.version = version
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(directory, exist_ok=True)
+
+    def key(self, path, *dependencies):
+        """Key of `path`, also covering the content of the files it depends on, if any."""
+        digest = hashlib.sha256(self.version.encode())
+        for p in (path, *dependencies):
+            digest.update(p.encode())
+            with open(p, "rb") as f:
+                digest.update(f.read())
+        return digest.hexdigest()
+
+    def _entry(self, key):
+        return os.path.join(self.directory, f"{key}.json")
+
+    def get(self, key):
+        entry = self._entry(key)
+        try:
+            with open(entry, encoding="utf-8") as f:
+                annotations = json.load(f)
+            os.utime(entry)
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return annotations
+
+    def put(self, key, annotations):
+        entry = self._entry(key)
+        tmp = f"{entry}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(annotations, f)
+        os.replace(tmp, entry)
+
+    def evict(self):
+        entries = []
+        total = 0
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if entry.name.endswith(".json"):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+                    total += stat.st_size
+        for _, size, path in sorted(entries):
+            if total <= self.max_size:
+                break
+            os.remove(path)
+            total -= size
+
+
+def linter_version(*files, packages=("strictyaml",)):
+    """Identify a linter by its source files and the installed versions of the packages it uses."""
+    from importlib.metadata import version, PackageNotFoundError
+
+    digest = hashlib.sha256()
+    for path in files:
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    for package in packages:
+        try:
+            digest.update(version(package).encode())
+        except PackageNotFoundError:
+            pass
+    return digest.hexdigest()
@@ -12,6 +12,7 @@ from conan.tools.layout import basic_layout
 from conan.tools.microsoft import is_msvc, is_msvc_static_runtime, MSBuildToolchain, msvc_runtime_flag, VCVars
 from conan.tools.scm import Version
 
+import functools
 import glob
 from io import StringIO
 import os
@@ -64,6 +65,34 @@ CONFIGURE_OPTIONS = (
 )
 
 
+def _dependency_closure(tree):
+    """
+    Transitive dependencies of every module, computed in a single pass over a topological order.
+    Only used for dependencies-x.y.z.yml files without a precomputed `all_dependencies`.
+    """
+    closure = {}
+    remaining = {k: set(v) for k, v in tree.items()}
+    while remaining:
+        ready = [k for k, v in remaining.items() if v.issubset(closure)]
+        if not ready:
+            raise ConanException(f"Dependency cycle detected in {sorted(remaining)}")
+        for module in ready:
+            closure[module] = set(remaining.pop(module))
+            for dependency in tree[module]:
+                closure[module].update(closure[dependency])
+    return {k: sorted(v) for k, v in closure.items()}
+
+
+@functools.lru_cache(maxsize=None)
+def _load_dependencies(dependencies_filepath):
+    # Shared by all instances of the recipe for the same version: treat as read-only
+    with open(dependencies_filepath, encoding='utf-8') as f:
+        dependencies = yaml.safe_load(f)
+    if "all_dependencies" not in dependencies:
+        dependencies["all_dependencies"] = _dependency_closure(dependencies["dependencies"])
+    return dependencies
+
+
 class BoostConan(ConanFile):
     name = "boost"
     description = "Boost provides free peer-reviewed portable C++ source libraries"
@@ -338,35 +367,15 @@ class BoostConan(ConanFile):
             dependencies_filepath = os.path.join(self.recipe_folder, "dependencies", self._dependency_filename)
             if not os.path.isfile(dependencies_filepath):
                 raise ConanException(f"Cannot find {dependencies_filepath}")
-            with open(dependencies_filepath, encoding='utf-8') as f:
-                self._cached_dependencies = yaml.safe_load(f)
+            self._cached_dependencies = _load_dependencies(dependencies_filepath)
         return self._cached_dependencies
 
     def _all_dependent_modules(self, name):
-        dependencies = {name}
-        while True:
-            new_dependencies = set()
-            for dependency in dependencies:
-                new_dependencies.update(set(self._dependencies["dependencies"][dependency]))
-                new_dependencies.update(dependencies)
-            if len(new_dependencies) > len(dependencies):
-                dependencies = new_dependencies
-            else:
-                break
-        return dependencies
+        return {name}.union(self._dependencies["all_dependencies"][name])
 
     def _all_super_modules(self, name):
-        dependencies = {name}
-        while True:
-            new_dependencies = set(dependencies)
-            for module in self._dependencies["dependencies"]:
-                if dependencies.intersection(set(self._dependencies["dependencies"][module])):
-                    new_dependencies.add(module)
-            if len(new_dependencies) > len(dependencies):
-                dependencies = new_dependencies
-            else:
-                break
-        return dependencies
+        return {name}.union(module for module, dependencies in self._dependencies["all_dependencies"].items()
+                            if name in dependencies)
 
     @property
     def _bcp_dir(self):
@@ -2,12 +2,15 @@
 
 import argparse
 import dataclasses
+import hashlib
 import json
 import logging
+import os
 import pprint
 import re
 import subprocess
 import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from typing import Dict, List, Tuple
 
@@ -94,6 +97,7 @@ class BoostDependenciesExport(object):
     version: str
     configure_options: List[str]
     dependencies: Dict[str, List[str]] = dataclasses.field(default_factory=dict)
+    all_dependencies: Dict[str, List[str]] = dataclasses.field(default_factory=dict)
     libs: Dict[str, List[str]] = dataclasses.field(default_factory=dict)
     requirements: Dict[str, List[str]] = dataclasses.field(default_factory=dict)
     static_only: List[str] = dataclasses.field(default_factory=list)
@@ -106,40 +110,60 @@ class BoostDependencies(object):
 
 
 class BoostDependencyBuilder(object):
-    def __init__(self, boost_version: str, boostdep_version: str, tmppath: Path, git_url: str, outputdir: Path, unsafe: bool):
+    def __init__(self, boost_version: str, boostdep_version: str, tmppath: Path, git_url: str, outputdir: Path, unsafe: bool,
+                 worktree: bool = False):
         self.boost_version = boost_version
         self.boostdep_version = boostdep_version
         self.git_url = git_url
         self.tmppath = tmppath
         self.outputdir = outputdir
         self.unsafe = unsafe
+        self.worktree = worktree
         self._boostdep = None
 
     @property
-    def boost_path(self) -> Path:
+    def main_boost_path(self) -> Path:
         return self.tmppath / "boost"
 
+    @property
+    def boost_path(self) -> Path:
+        if self.worktree:
+            return self.tmppath / "boost-worktrees" / self.boost_version
+        return self.main_boost_path
+
+    @property
+    def tree_hash(self) -> str:
+        """Hash of the boost superproject tree at this version, which pins all submodule commits."""
+        return subprocess.check_output(["git", "-C", str(self.main_boost_path), "rev-parse", f"boost-{self.boost_version}^{{tree}}"],
+                                       text=True).strip()
+
     def do_git_update(self) -> None:
-        if not self.boost_path.exists():
+        # Always the main clone: worktrees are created from it afterwards
+        if not self.main_boost_path.exists():
             with chdir(self, self.tmppath):
                 print("Cloning boost git")
                 subprocess.check_call(["git", "clone", "--", self.git_url, "boost"])
-            with chdir(self, self.boost_path):
+            with chdir(self, self.main_boost_path):
                 print("Checking out current master")
                 subprocess.check_call(["git", "checkout", "origin/master"])
                 print("Removing master branch")
                 subprocess.check_call(["git", "branch", "-D", "master"])
         else:
-            with chdir(self, self.boost_path):
+            with chdir(self, self.main_boost_path):
                 print("Updating git repo")
                 subprocess.check_call(["git", "fetch", "origin"])
                 print("Removing all local changes to git repo")
                 subprocess.check_call(["git", "reset", "--hard", "HEAD"])
                 print("Checking out current master")
                 subprocess.check_call(["git", "checkout", "origin/master"])
+        if self.worktree:
+            with chdir(self, self.main_boost_path):
+                # Fetched once here, the worktrees clone their submodules from these
+                print("Updating git submodules")
+                subprocess.check_call(["git", "submodule", "update", "--init"])
 
     def do_git_submodule_update(self):
-        with chdir(self, self.boost_path):
+        with chdir(self, self.main_boost_path):
             if not self.unsafe:
                 # De-init + init to make sure that boostdep won't detect a new or removed boost library
                 print("De-init git submodules")
@@ -158,8 +182,43 @@ class BoostDependencyBuilder(object):
             print("Removing unknown files/directories")
             subprocess.check_call(["git", "clean", "-d", "-f"])
 
-    def do_install_boostdep(self):
+    def do_git_worktree_update(self):
+        """
+        Check out this version in its own worktree of the main clone, so several versions can be processed at once.
+        Submodules are cloned from the ones already present in the main clone when possible instead of from the network.
+
+        Linked worktrees share the config of the main clone, so the submodule urls are only passed on the command
+        line: concurrent workers would otherwise race on its lock, and the urls of the main clone would be rewritten.
+        """
+        if self.boost_path.exists():
+            subprocess.check_call(["git", "-C", str(self.main_boost_path), "worktree", "remove", "--force", str(self.boost_path)])
+        print(f"Adding worktree for version {self.boost_version}")
+        subprocess.check_call(["git", "-C", str(self.main_boost_path), "worktree", "add", "--detach", str(self.boost_path), f"boost-{self.boost_version}"])
         with chdir(self, self.boost_path):
+            urls = subprocess.check_output(["git", "config", "-f", ".gitmodules", "--get-regexp", r"^submodule\..*\.url$"], text=True)
+            config = ["-c", "protocol.file.allow=always"]
+            for line in urls.splitlines():
+                key, url = line.split(maxsplit=1)
+                name = key[len("submodule."):-len(".url")]
+                local_module = self.main_boost_path / ".git" / "modules" / name
+                url = str(local_module) if local_module.is_dir() else self._resolve_submodule_url(url)
+                # Set beforehand, `submodule update --init` does not write the url or active flag to the config
+                config += ["-c", f"submodule.{name}.url={url}", "-c", f"submodule.{name}.active=true"]
+            subprocess.check_call(["git", *config, "submodule", "update", "--init"])
+
+    def _resolve_submodule_url(self, url: str) -> str:
+        """Resolve a url of .gitmodules relative to the superproject, as `git submodule init` does."""
+        if not url.startswith(("./", "../")):
+            return url
+        base = self.git_url.rstrip("/")
+        while url.startswith(("./", "../")):
+            if url.startswith("../"):
+                base = base.rsplit("/", 1)[0]
+            url = url.split("/", 1)[1]
+        return f"{base}/{url}"
+
+    def do_install_boostdep(self):
+        with chdir(self, self.main_boost_path):
             print(f"Installing boostdep/{self.boostdep_version}")
             cmd = ["conan", "install", "--tool-requires", f"boostdep/{self.boostdep_version}", "--format", "json", "-vquiet"]
             info = json.loads(subprocess.check_output(cmd))
@@ -296,6 +355,21 @@ class BoostDependencyBuilder(object):
             tree = {k: [d for d in v if d not in nodeps] for k, v in tree.items() if k not in nodeps}
         return {}
 
+    @staticmethod
+    def dependency_closure(tree: Dict[str, List[str]]) -> Dict[str, List[str]]:
+        """Transitive dependencies of every module, computed in a single pass over a topological order."""
+        closure = {}
+        remaining = {k: set(v) for k, v in tree.items()}
+        while remaining:
+            ready = [k for k, v in remaining.items() if v.issubset(closure)]
+            if not ready:
+                raise Exception(f"Dependency cycle detected. Remaining tree: {remaining}")
+            for module in ready:
+                closure[module] = set(remaining.pop(module))
+                for dependency in tree[module]:
+                    closure[module].update(closure[dependency])
+        return {k: sorted(v) for k, v in closure.items()}
+
     def _fix_dependencies(self, deptree: Dict[str, List[str]]) -> Dict[str, List[str]]:
         try:
             # python does not depend on graph
@@ -412,6 +486,7 @@ class BoostDependencyBuilder(object):
         tree = self.do_create_libraries(tree)
 
         tree.export.dependencies = self._fix_dependencies(tree.export.dependencies)
+        tree.export.all_dependencies = self.dependency_closure(tree.export.dependencies)
 
         data = dataclasses.asdict(tree.export)
         if self.unsafe:
@@ -424,15 +499,43 @@ class BoostDependencyBuilder(object):
             yaml.dump(data, fout)
 
 
+def _script_hash() -> str:
+    return hashlib.sha256(Path(__file__).read_bytes()).hexdigest()
+
+
+def _state_path(tmppath: Path) -> Path:
+    return tmppath / "boost-dependencies-state.json"
+
+
+def _load_state(tmppath: Path) -> Dict[str, Dict[str, str]]:
+    try:
+        return json.loads(_state_path(tmppath).read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def _run_worktree(builder: BoostDependencyBuilder, boostdep: Path) -> str:
+    """Generate the dependency file of one version in its own worktree (executed in a worker process)."""
+    builder.do_git_worktree_update()
+    builder._boostdep = boostdep
+    builder.do_create_dependency_file()
+    subprocess.check_call(["git", "-C", str(builder.main_boost_path), "worktree", "remove", "--force", str(builder.boost_path)])
+    return builder.boost_version
+
+
 def main(args=None) -> int:
     parser = argparse.ArgumentParser()
     parser.add_argument("--verbose", dest="verbose", action="store_true", help="verbose output")
-    parser.add_argument("-t", dest="tmppath", help="temporary folder where to clone boost (default is system temporary folder)")
+    parser.add_argument("-t", dest="tmppath", type=Path, help="temporary folder where to clone boost (default is system temporary folder)")
     parser.add_argument("-d", dest="boostdep_version", default="1.82.0", type=str, help="boostdep version")
     parser.add_argument("-u", dest="git_url", default=BOOST_GIT_URL, help="boost git url")
     parser.add_argument("-U", dest="git_update", action="store_true", help="update the git repo")
     parser.add_argument("-o", dest="outputdir", default=None, type=Path, help="output dependency dir")
     parser.add_argument("-x", dest="unsafe", action="store_true", help="unsafe fast(er) operation")
+    parser.add_argument("-j", dest="jobs", type=int, default=None,
+                        help="process versions in parallel using one git worktree per version and this many processes")
+    parser.add_argument("-f", dest="force", action="store_true",
+                        help="regenerate versions even if neither their boost tree nor this script changed since the last run")
 
     version_group = parser.add_mutually_exclusive_group(required=True)
     version_group.add_argument("-v", dest="boost_version", help="boost version")
@@ -452,38 +555,69 @@ def main(args=None) -> int:
 
     ns.outputdir.mkdir(exist_ok=True)
 
-    git_update_done = False
-
     if ns.boost_version is None:
         conan_data = yaml.safe_load(Path("conandata.yml").open())
         boost_versions = list(conan_data["sources"].keys())
     else:
         boost_versions = [ns.boost_version]
 
-    for boost_version in boost_versions:
-        print(f"Starting {boost_version}")
-        boost_collector = BoostDependencyBuilder(
-            boost_version=boost_version,
-            boostdep_version=ns.boostdep_version,
-            git_url=ns.git_url,
-            outputdir=ns.outputdir,
-            tmppath=ns.tmppath,
-            unsafe=ns.unsafe,
-        )
-
-        if not ns.git_update and not boost_collector.boost_path.exists():
-            log.error("Boost directory does not exist. Re-execute this script with -U to run 'git update'.")
-            return 1
-
-        if ns.git_update and not git_update_done:
-            boost_collector.do_git_update()
-            git_update_done = True
-
-        boost_collector.do_git_submodule_update()
-
-        boost_collector.do_install_boostdep()
-
-        boost_collector.do_create_dependency_file()
+    builders = [BoostDependencyBuilder(
+        boost_version=boost_version,
+        boostdep_version=ns.boostdep_version,
+        git_url=ns.git_url,
+        outputdir=ns.outputdir,
+        tmppath=ns.tmppath,
+        unsafe=ns.unsafe,
+        worktree=ns.jobs is not None,
+    ) for boost_version in boost_versions]
+
+    if not ns.git_update and not builders[0].main_boost_path.exists():
+        log.error("Boost directory does not exist. Re-execute this script with -U to run 'git update'.")
+        return 1
+
+    if ns.git_update:
+        builders[0].do_git_update()
+
+    # Skip versions whose boost tree and generator did not change since they were last generated
+    state = _load_state(ns.tmppath)
+    script_hash = _script_hash()
+    keys = {}
+    todo = []
+    for builder in builders:
+        keys[builder.boost_version] = {"tree": builder.tree_hash, "script": script_hash, "boostdep": ns.boostdep_version}
+        if not ns.force and builder._outputpath.is_file() and state.get(builder.boost_version) == keys[builder.boost_version]:
+            print(f"Skipping {builder.boost_version}: up to date")
+            continue
+        todo.append(builder)
+
+    def _done(boost_version):
+        state[boost_version] = keys[boost_version]
+        _state_path(ns.tmppath).write_text(json.dumps(state, indent=2, sort_keys=True))
+
+    if ns.jobs is None:
+        for boost_collector in todo:
+            print(f"Starting {boost_collector.boost_version}")
+            boost_collector.do_git_submodule_update()
+
+            boost_collector.do_install_boostdep()
+
+            boost_collector.do_create_dependency_file()
+            _done(boost_collector.boost_version)
+        return 0
+
+    if not todo:
+        return 0
+    # boostdep only needs to be installed once, concurrent `conan install` calls would race on the cache
+    todo[0].do_install_boostdep()
+    boostdep = todo[0]._boostdep
+    (ns.tmppath / "boost-worktrees").mkdir(exist_ok=True)
+    subprocess.check_call(["git", "-C", str(todo[0].main_boost_path), "worktree", "prune"])
+    with ProcessPoolExecutor(max_workers=ns.jobs or os.cpu_count()) as executor:
+        futures = [executor.submit(_run_worktree, builder, boostdep) for builder in todo]
+        for future in as_completed(futures):
+            boost_version = future.result()
+            print(f"Finished {boost_version}")
+            _done(boost_version)
     return 0
 
 
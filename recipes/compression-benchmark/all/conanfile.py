@@ -0,0 +1,171 @@
+from conan import ConanFile
+from conan.errors import ConanInvalidConfiguration
+from conan.tools.build import check_min_cppstd
+from conan.tools.cmake import CMake, CMakeDeps, CMakeToolchain, cmake_layout
+from conan.tools.files import copy, save
+from conan.tools.scm import Version
+import json
+import os
+import textwrap
+
+required_conan_version = ">=1.53.0"
+
+
+class CompressionBenchmarkConan(ConanFile):
+    name = "compression-benchmark"
+    description = ("Compression ratio and compress/decompress throughput of zlib, zlib-ng, libdeflate, "
+                   "isa-l, zstd, lz4, brotli and snappy over a corpus of files, as CSV or JSON")
+    license = "MIT"
+    url = "https://github.com/conan-io/conan-center-index"
+    # There is no upstream project, the sources are maintained in this repository under src/
+    homepage = "https://github.com/valgur/conan-center-index"
+    topics = ("compression", "benchmark", "zlib", "zstd", "lz4", "brotli", "snappy")
+    package_type = "application"
+    settings = "os", "arch", "compiler", "build_type"
+    options = {
+        "with_zlib": [True, False],
+        "with_zlib_ng": [True, False],
+        "with_libdeflate": [True, False],
+        "with_isal": [True, False],
+        "with_zstd": [True, False],
+        "with_lz4": [True, False],
+        "with_brotli": [True, False],
+        "with_snappy": [True, False],
+    }
+    default_options = {
+        "with_zlib": True,
+        "with_zlib_ng": True,
+        "with_libdeflate": True,
+        "with_isal": True,
+        "with_zstd": True,
+        "with_lz4": True,
+        "with_brotli": True,
+        "with_snappy": True,
+    }
+    exports_sources = "src/*"
+
+    @property
+    def _min_cppstd(self):
+        return 17
+
+    @property
+    def _compilers_minimum_version(self):
+        # std::filesystem without an extra library
+        return {
+            "gcc": "9",
+            "clang": "9",
+            "apple-clang": "11",
+            "Visual Studio": "16",
+            "msvc": "192",
+        }
+
+    @property
+    def _codecs(self):
+        # option: (package, codec id used by src/CMakeLists.txt)
+        return {
+            "with_zlib": ("zlib", "ZLIB"),
+            "with_zlib_ng": ("zlib-ng", "ZLIB_NG"),
+            "with_libdeflate": ("libdeflate", "LIBDEFLATE"),
+            "with_isal": ("isa-l", "ISAL"),
+            "with_zstd": ("zstd", "ZSTD"),
+            "with_lz4": ("lz4", "LZ4"),
+            "with_brotli": ("brotli", "BROTLI"),
+            "with_snappy": ("snappy", "SNAPPY"),
+        }
+
+    @property
+    def _enabled_codecs(self):
+        return {package: codec for option, (package, codec) in self._codecs.items() if self.options.get_safe(option)}
+
+    def config_options(self):
+        # isa-l only supports x86
+        if self.settings.arch not in ("x86", "x86_64"):
+            del self.options.with_isal
+
+    def layout(self):
+        cmake_layout(self, src_folder="src")
+
+    def requirements(self):
+        if self.options.with_zlib:
+            self.requires("zlib/[>=1.2.11 <2]")
+        if self.options.with_zlib_ng:
+            self.requires("zlib-ng/2.2.2")
+        if self.options.with_libdeflate:
+            self.requires("libdeflate/1.22")
+        if self.options.get_safe("with_isal"):
+            self.requires("isa-l/2.30.0")
+        if self.options.with_zstd:
+            self.requires("zstd/[>=1.5 <1.6]")
+        if self.options.with_lz4:
+            self.requires("lz4/1.10.0")
+        if self.options.with_brotli:
+            self.requires("brotli/1.1.0")
+        if self.options.with_snappy:
+            self.requires("snappy/1.2.1")
+
+    def validate(self):
+        if self.settings.compiler.get_safe("cppstd"):
+            check_min_cppstd(self, self._min_cppstd)
+        minimum_version = self._compilers_minimum_version.get(str(self.settings.compiler), False)
+        if minimum_version and Version(self.settings.compiler.version) < minimum_version:
+            raise ConanInvalidConfiguration(
+                f"{self.ref} requires C++{self._min_cppstd}, which your compiler does not support."
+            )
+        if not self._enabled_codecs:
+            raise ConanInvalidConfiguration(f"{self.ref} needs at least one codec enabled")
+        if self.options.with_zlib_ng and self.dependencies["zlib-ng"].options.zlib_compat:
+            raise ConanInvalidConfiguration(
+                f"{self.ref} uses the native zlib-ng API, zlib-ng/*:zlib_compat must be False. "
+                "Use zlib/*:backend=zlib-ng to benchmark zlib-ng through the zlib API."
+            )
+
+    def build_requirements(self):
+        self.tool_requires("cmake/[>=3.15 <4]")
+
+    def generate(self):
+        tc = CMakeToolchain(self)
+        codecs = self._enabled_codecs
+        tc.cache_variables["CODECS"] = ";".join(codecs.values())
+        for package, codec in codecs.items():
+            cpp_info = self.dependencies[package].cpp_info
+            tc.cache_variables[f"{codec}_PACKAGE"] = cpp_info.get_property("cmake_file_name") or package
+            tc.cache_variables[f"{codec}_TARGET"] = cpp_info.get_property("cmake_target_name") or f"{package}::{package}"
+        tc.generate()
+        deps = CMakeDeps(self)
+        deps.generate()
+
+        # Printed by --configuration and written in the JSON results, so that results of
+        # builds with different codec options can be told apart
+        configuration = {
+            "os": str(self.settings.os),
+            "arch": str(self.settings.arch),
+            "compiler": f"{self.settings.compiler} {self.settings.compiler.version}",
+            "build_type": str(self.settings.build_type),
+            "codecs": {
+                package: {
+                    "reference": str(self.dependencies[package].ref),
+                    "options": dict(self.dependencies[package].options.items()),
+                }
+                for package in codecs
+            },
+        }
+        save(self, os.path.join(self.build_folder, "build_configuration.h"), textwrap.dedent(f"""\
+            #pragma once
+            #define BUILD_CONFIGURATION R"json({json.dumps(configuration, sort_keys=True)})json"
+        """))
+
+    def build(self):
+        cmake = CMake(self)
+        cmake.configure()
+        cmake.build()
+
+    def package(self):
+        copy(self, "LICENSE", src=self.source_folder, dst=os.path.join(self.package_folder, "licenses"))
+        cmake = CMake(self)
+        cmake.install()
+
+    def package_info(self):
+        self.cpp_info.includedirs = []
+        self.cpp_info.libdirs = []
+        self.cpp_info.frameworkdirs = []
+        self.cpp_info.resdirs = []
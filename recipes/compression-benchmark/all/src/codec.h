@@ -0,0 +1,49 @@
+#pragma once
+
+#include <cstddef>
+#include <cstdint>
+#include <memory>
+#include <stdexcept>
+#include <string>
+#include <vector>
+
+class Codec {
+public:
+    virtual ~Codec() = default;
+    // Size of the buffer compress() needs for `size` bytes of input
+    virtual size_t bound(size_t size) = 0;
+    // Returns the compressed size, throws on error
+    virtual size_t compress(const uint8_t *src, size_t size, uint8_t *dst, size_t capacity) = 0;
+    // Decompresses exactly `original_size` bytes, throws on error
+    virtual void decompress(const uint8_t *src, size_t size, uint8_t *dst, size_t original_size) = 0;
+};
+
+struct CodecFactory {
+    std::string name;
+    std::vector<int> default_levels;
+    // `threads` is only used by codecs with multi-threaded compression
+    std::unique_ptr<Codec> (*create)(int level, int threads);
+};
+
+inline void check(bool success, const std::string &codec, const char *what) {
+    if (!success) {
+        throw std::runtime_error(codec + ": " + what + " failed");
+    }
+}
+
+inline void check_level(int level, int minimum, int maximum, const std::string &codec) {
+    if (level < minimum || level > maximum) {
+        throw std::invalid_argument(codec + ": level " + std::to_string(level) + " is out of range [" +
+                                    std::to_string(minimum) + ", " + std::to_string(maximum) + "]");
+    }
+}
+
+// One per codec_*.cpp file, only those enabled in the build are linked
+CodecFactory zlib_codec();
+CodecFactory zlib_ng_codec();
+CodecFactory libdeflate_codec();
+CodecFactory isal_codec();
+CodecFactory zstd_codec();
+CodecFactory lz4_codec();
+CodecFactory brotli_codec();
+CodecFactory snappy_codec();
@@ -0,0 +1,42 @@
+#include "codec.h"
+
+#include <brotli/decode.h>
+#include <brotli/encode.h>
+
+namespace {
+
+class BrotliCodec : public Codec {
+public:
+    explicit BrotliCodec(int quality) : quality_(quality) {}
+
+    size_t bound(size_t size) override {
+        return BrotliEncoderMaxCompressedSize(size);
+    }
+
+    size_t compress(const uint8_t *src, size_t size, uint8_t *dst, size_t capacity) override {
+        size_t compressed = capacity;
+        check(BrotliEncoderCompress(quality_, BROTLI_DEFAULT_WINDOW, BROTLI_MODE_GENERIC, size, src, &compressed, dst)
+                  == BROTLI_TRUE,
+              "brotli", "BrotliEncoderCompress");
+        return compressed;
+    }
+
+    void decompress(const uint8_t *src, size_t size, uint8_t *dst, size_t original_size) override {
+        size_t decompressed = original_size;
+        BrotliDecoderResult result = BrotliDecoderDecompress(size, src, &decompressed, dst);
+        check(result == BROTLI_DECODER_RESULT_SUCCESS && decompressed == original_size, "brotli",
+              "BrotliDecoderDecompress");
+    }
+
+private:
+    int quality_;
+};
+
+} // namespace
+
+CodecFactory brotli_codec() {
+    return {"brotli", {1, 5, 9}, [](int level, int) -> std::unique_ptr<Codec> {
+        check_level(level, BROTLI_MIN_QUALITY, BROTLI_MAX_QUALITY, "brotli");
+        return std::make_unique<BrotliCodec>(level);
+    }};
+}
@@ -0,0 +1,60 @@
+#include "codec.h"
+
+#include <isa-l.h>
+
+namespace {
+
+class IsalCodec : public Codec {
+public:
+    explicit IsalCodec(int level) : level_(level) {
+        const uint32_t level_buffer_sizes[] = {
+            ISAL_DEF_LVL0_DEFAULT, ISAL_DEF_LVL1_DEFAULT, ISAL_DEF_LVL2_DEFAULT, ISAL_DEF_LVL3_DEFAULT,
+        };
+        level_buffer_.resize(level_buffer_sizes[level]);
+    }
+
+    size_t bound(size_t size) override {
+        // Incompressible data is stored, which costs a few bytes per block
+        return size + size / 8 + ISAL_DEF_MAX_HDR_SIZE + 1024;
+    }
+
+    size_t compress(const uint8_t *src, size_t size, uint8_t *dst, size_t capacity) override {
+        isal_deflate_stateless_init(&stream_);
+        stream_.level = static_cast<uint32_t>(level_);
+        stream_.level_buf = level_buffer_.data();
+        stream_.level_buf_size = static_cast<uint32_t>(level_buffer_.size());
+        stream_.end_of_stream = 1;
+        stream_.flush = NO_FLUSH;
+        stream_.next_in = const_cast<uint8_t *>(src);
+        stream_.avail_in = static_cast<uint32_t>(size);
+        stream_.next_out = dst;
+        stream_.avail_out = static_cast<uint32_t>(capacity);
+        check(isal_deflate_stateless(&stream_) == COMP_OK, "isa-l", "isal_deflate_stateless");
+        return stream_.total_out;
+    }
+
+    void decompress(const uint8_t *src, size_t size, uint8_t *dst, size_t original_size) override {
+        isal_inflate_init(&state_);
+        state_.next_in = const_cast<uint8_t *>(src);
+        state_.avail_in = static_cast<uint32_t>(size);
+        state_.next_out = dst;
+        state_.avail_out = static_cast<uint32_t>(original_size);
+        int result = isal_inflate_stateless(&state_);
+        check(result == ISAL_DECOMP_OK && state_.total_out == original_size, "isa-l", "isal_inflate_stateless");
+    }
+
+private:
+    int level_;
+    std::vector<uint8_t> level_buffer_;
+    isal_zstream stream_;
+    inflate_state state_;
+};
+
+} // namespace
+
+CodecFactory isal_codec() {
+    return {"isa-l", {0, 1, 3}, [](int level, int) -> std::unique_ptr<Codec> {
+        check_level(level, 0, ISAL_DEF_MAX_LEVEL, "isa-l");
+        return std::make_unique<IsalCodec>(level);
+    }};
+}
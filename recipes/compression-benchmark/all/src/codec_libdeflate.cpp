@@ -0,0 +1,47 @@
+#include "codec.h"
+
+#include <libdeflate.h>
+
+namespace {
+
+class LibdeflateCodec : public Codec {
+public:
+    explicit LibdeflateCodec(int level)
+        : compressor_(libdeflate_alloc_compressor(level)), decompressor_(libdeflate_alloc_decompressor()) {
+        check(compressor_ != nullptr && decompressor_ != nullptr, "libdeflate", "allocation");
+    }
+
+    ~LibdeflateCodec() override {
+        libdeflate_free_compressor(compressor_);
+        libdeflate_free_decompressor(decompressor_);
+    }
+
+    size_t bound(size_t size) override {
+        return libdeflate_deflate_compress_bound(compressor_, size);
+    }
+
+    size_t compress(const uint8_t *src, size_t size, uint8_t *dst, size_t capacity) override {
+        size_t compressed = libdeflate_deflate_compress(compressor_, src, size, dst, capacity);
+        check(compressed != 0, "libdeflate", "libdeflate_deflate_compress");
+        return compressed;
+    }
+
+    void decompress(const uint8_t *src, size_t size, uint8_t *dst, size_t original_size) override {
+        // Without an actual_out_nbytes_ret pointer, the output must fill exactly original_size bytes
+        libdeflate_result result = libdeflate_deflate_decompress(decompressor_, src, size, dst, original_size, nullptr);
+        check(result == LIBDEFLATE_SUCCESS, "libdeflate", "libdeflate_deflate_decompress");
+    }
+
+private:
+    libdeflate_compressor *compressor_;
+    libdeflate_decompressor *decompressor_;
+};
+
+} // namespace
+
+CodecFactory libdeflate_codec() {
+    return {"libdeflate", {1, 6, 12}, [](int level, int) -> std::unique_ptr<Codec> {
+        check_level(level, 0, 12, "libdeflate");
+        return std::make_unique<LibdeflateCodec>(level);
+    }};
+}
@@ -0,0 +1,50 @@
+#include "codec.h"
+
+#include <lz4.h>
+#include <lz4hc.h>
+
+namespace {
+
+// Level 0 is LZ4_compress_default, negative levels are LZ4_compress_fast with that
+// acceleration and positive levels are LZ4_compress_HC.
+class Lz4Codec : public Codec {
+public:
+    explicit Lz4Codec(int level) : level_(level) {}
+
+    size_t bound(size_t size) override {
+        return static_cast<size_t>(LZ4_compressBound(static_cast<int>(size)));
+    }
+
+    size_t compress(const uint8_t *src, size_t size, uint8_t *dst, size_t capacity) override {
+        const char *in = reinterpret_cast<const char *>(src);
+        char *out = reinterpret_cast<char *>(dst);
+        int compressed;
+        if (level_ == 0) {
+            compressed = LZ4_compress_default(in, out, static_cast<int>(size), static_cast<int>(capacity));
+        } else if (level_ < 0) {
+            compressed = LZ4_compress_fast(in, out, static_cast<int>(size), static_cast<int>(capacity), -level_);
+        } else {
+            compressed = LZ4_compress_HC(in, out, static_cast<int>(size), static_cast<int>(capacity), level_);
+        }
+        check(compressed > 0 || size == 0, "lz4", "compression");
+        return static_cast<size_t>(compressed);
+    }
+
+    void decompress(const uint8_t *src, size_t size, uint8_t *dst, size_t original_size) override {
+        int decompressed = LZ4_decompress_safe(reinterpret_cast<const char *>(src), reinterpret_cast<char *>(dst),
+                                               static_cast<int>(size), static_cast<int>(original_size));
+        check(decompressed >= 0 && static_cast<size_t>(decompressed) == original_size, "lz4", "LZ4_decompress_safe");
+    }
+
+private:
+    int level_;
+};
+
+} // namespace
+
+CodecFactory lz4_codec() {
+    return {"lz4", {0, 9}, [](int level, int) -> std::unique_ptr<Codec> {
+        check_level(level, -65537, LZ4HC_CLEVEL_MAX, "lz4");
+        return std::make_unique<Lz4Codec>(level);
+    }};
+}
@@ -0,0 +1,36 @@
+#include "codec.h"
+
+#include <snappy.h>
+
+namespace {
+
+// Snappy has no compression levels
+class SnappyCodec : public Codec {
+public:
+    size_t bound(size_t size) override {
+        return snappy::MaxCompressedLength(size);
+    }
+
+    size_t compress(const uint8_t *src, size_t size, uint8_t *dst, size_t) override {
+        size_t compressed = 0;
+        snappy::RawCompress(reinterpret_cast<const char *>(src), size, reinterpret_cast<char *>(dst), &compressed);
+        return compressed;
+    }
+
+    void decompress(const uint8_t *src, size_t size, uint8_t *dst, size_t original_size) override {
+        const char *in = reinterpret_cast<const char *>(src);
+        size_t decompressed = 0;
+        check(snappy::GetUncompressedLength(in, size, &decompressed) && decompressed == original_size, "snappy",
+              "GetUncompressedLength");
+        check(snappy::RawUncompress(in, size, reinterpret_cast<char *>(dst)), "snappy", "RawUncompress");
+    }
+};
+
+} // namespace
+
+CodecFactory snappy_codec() {
+    return {"snappy", {0}, [](int level, int) -> std::unique_ptr<Codec> {
+        check_level(level, 0, 0, "snappy");
+        return std::make_unique<SnappyCodec>();
+    }};
+}
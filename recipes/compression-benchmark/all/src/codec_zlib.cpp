@@ -0,0 +1,38 @@
+#include "codec.h"
+
+#include <zlib.h>
+
+namespace {
+
+class ZlibCodec : public Codec {
+public:
+    explicit ZlibCodec(int level) : level_(level) {}
+
+    size_t bound(size_t size) override {
+        return compressBound(static_cast<uLong>(size));
+    }
+
+    size_t compress(const uint8_t *src, size_t size, uint8_t *dst, size_t capacity) override {
+        uLongf compressed = static_cast<uLongf>(capacity);
+        check(compress2(dst, &compressed, src, static_cast<uLong>(size), level_) == Z_OK, "zlib", "compress2");
+        return compressed;
+    }
+
+    void decompress(const uint8_t *src, size_t size, uint8_t *dst, size_t original_size) override {
+        uLongf decompressed = static_cast<uLongf>(original_size);
+        int result = uncompress(dst, &decompressed, src, static_cast<uLong>(size));
+        check(result == Z_OK && decompressed == original_size, "zlib", "uncompress");
+    }
+
+private:
+    int level_;
+};
+
+} // namespace
+
+CodecFactory zlib_codec() {
+    return {"zlib", {1, 6, 9}, [](int level, int) -> std::unique_ptr<Codec> {
+        check_level(level, 0, 9, "zlib");
+        return std::make_unique<ZlibCodec>(level);
+    }};
+}
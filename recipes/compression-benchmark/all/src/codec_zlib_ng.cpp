@@ -0,0 +1,39 @@
+#include "codec.h"
+
+#include <zlib-ng.h>
+
+namespace {
+
+// Native zlib-ng API, zlib-ng must be built with zlib_compat=False
+class ZlibNgCodec : public Codec {
+public:
+    explicit ZlibNgCodec(int level) : level_(level) {}
+
+    size_t bound(size_t size) override {
+        return zng_compressBound(size);
+    }
+
+    size_t compress(const uint8_t *src, size_t size, uint8_t *dst, size_t capacity) override {
+        size_t compressed = capacity;
+        check(zng_compress2(dst, &compressed, src, size, level_) == Z_OK, "zlib-ng", "zng_compress2");
+        return compressed;
+    }
+
+    void decompress(const uint8_t *src, size_t size, uint8_t *dst, size_t original_size) override {
+        size_t decompressed = original_size;
+        int result = zng_uncompress(dst, &decompressed, src, size);
+        check(result == Z_OK && decompressed == original_size, "zlib-ng", "zng_uncompress");
+    }
+
+private:
+    int level_;
+};
+
+} // namespace
+
+CodecFactory zlib_ng_codec() {
+    return {"zlib-ng", {1, 6, 9}, [](int level, int) -> std::unique_ptr<Codec> {
+        check_level(level, 0, 9, "zlib-ng");
+        return std::make_unique<ZlibNgCodec>(level);
+    }};
+}
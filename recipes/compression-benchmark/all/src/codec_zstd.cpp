@@ -0,0 +1,52 @@
+#include "codec.h"
+
+#include <zstd.h>
+
+namespace {
+
+class ZstdCodec : public Codec {
+public:
+    ZstdCodec(int level, int threads) : cctx_(ZSTD_createCCtx()), dctx_(ZSTD_createDCtx()) {
+        check(cctx_ != nullptr && dctx_ != nullptr, "zstd", "context allocation");
+        check(!ZSTD_isError(ZSTD_CCtx_setParameter(cctx_, ZSTD_c_compressionLevel, level)), "zstd",
+              "setting the compression level");
+        if (threads > 0) {
+            // Fails when zstd is built with threading=False
+            check(!ZSTD_isError(ZSTD_CCtx_setParameter(cctx_, ZSTD_c_nbWorkers, threads)), "zstd",
+                  "setting the number of worker threads");
+        }
+    }
+
+    ~ZstdCodec() override {
+        ZSTD_freeCCtx(cctx_);
+        ZSTD_freeDCtx(dctx_);
+    }
+
+    size_t bound(size_t size) override {
+        return ZSTD_compressBound(size);
+    }
+
+    size_t compress(const uint8_t *src, size_t size, uint8_t *dst, size_t capacity) override {
+        size_t compressed = ZSTD_compress2(cctx_, dst, capacity, src, size);
+        check(!ZSTD_isError(compressed), "zstd", "ZSTD_compress2");
+        return compressed;
+    }
+
+    void decompress(const uint8_t *src, size_t size, uint8_t *dst, size_t original_size) override {
+        size_t decompressed = ZSTD_decompressDCtx(dctx_, dst, original_size, src, size);
+        check(!ZSTD_isError(decompressed) && decompressed == original_size, "zstd", "ZSTD_decompressDCtx");
+    }
+
+private:
+    ZSTD_CCtx *cctx_;
+    ZSTD_DCtx *dctx_;
+};
+
+} // namespace
+
+CodecFactory zstd_codec() {
+    return {"zstd", {1, 3, 9}, [](int level, int threads) -> std::unique_ptr<Codec> {
+        check_level(level, ZSTD_minCLevel(), ZSTD_maxCLevel(), "zstd");
+        return std::make_unique<ZstdCodec>(level, threads);
+    }};
+}
@@ -0,0 +1,398 @@
+// Compress and decompress every file of a corpus with each codec and level, and report the
+// compression ratio and the throughput of both directions as CSV or JSON.
+
+#include "codec.h"
+
+#include <algorithm>
+#include <chrono>
+#include <climits>
+#include <cstdio>
+#include <cstring>
+#include <filesystem>
+#include <fstream>
+#include <iostream>
+#include <sstream>
+
+#if __has_include("build_configuration.h")
+#include "build_configuration.h"
+#else
+#define BUILD_CONFIGURATION "{}"
+#endif
+
+namespace fs = std::filesystem;
+
+namespace {
+
+struct CorpusFile {
+    std::string path;
+    std::vector<uint8_t> data;
+};
+
+struct Result {
+    std::string codec;
+    int level;
+    std::string file;  // empty for the total over the corpus
+    size_t original_bytes = 0;
+    size_t compressed_bytes = 0;
+    double compress_seconds = 0;
+    double decompress_seconds = 0;
+};
+
+struct Selection {
+    const CodecFactory *factory;
+    std::vector<int> levels;
+};
+
+std::vector<CodecFactory> available_codecs() {
+    std::vector<CodecFactory> codecs;
+#ifdef WITH_ZLIB
+    codecs.push_back(zlib_codec());
+#endif
+#ifdef WITH_ZLIB_NG
+    codecs.push_back(zlib_ng_codec());
+#endif
+#ifdef WITH_LIBDEFLATE
+    codecs.push_back(libdeflate_codec());
+#endif
+#ifdef WITH_ISAL
+    codecs.push_back(isal_codec());
+#endif
+#ifdef WITH_ZSTD
+    codecs.push_back(zstd_codec());
+#endif
+#ifdef WITH_LZ4
+    codecs.push_back(lz4_codec());
+#endif
+#ifdef WITH_BROTLI
+    codecs.push_back(brotli_codec());
+#endif
+#ifdef WITH_SNAPPY
+    codecs.push_back(snappy_codec());
+#endif
+    return codecs;
+}
+
+std::vector<uint8_t> read_file(const fs::path &path) {
+    std::ifstream stream(path, std::ios::binary);
+    std::vector<uint8_t> data((std::istreambuf_iterator<char>(stream)), std::istreambuf_iterator<char>());
+    if (!stream.good() && !stream.eof()) {
+        throw std::runtime_error("cannot read " + path.string());
+    }
+    return data;
+}
+
+// Regular files of `paths`, directories searched recursively, in a stable order
+std::vector<CorpusFile> load_corpus(const std::vector<std::string> &paths) {
+    std::vector<fs::path> files;
+    for (const auto &path : paths) {
+        if (fs::is_directory(path)) {
+            for (const auto &entry : fs::recursive_directory_iterator(path)) {
+                if (entry.is_regular_file()) {
+                    files.push_back(entry.path());
+                }
+            }
+        } else if (fs::is_regular_file(path)) {
+            files.emplace_back(path);
+        } else {
+            throw std::runtime_error(path + " is not a file or directory");
+        }
+    }
+    std::sort(files.begin(), files.end());
+
+    std::vector<CorpusFile> corpus;
+    for (const auto &file : files) {
+        std::vector<uint8_t> data = read_file(file);
+        if (data.empty()) {
+            continue;
+        }
+        // Several codecs take sizes as int
+        if (data.size() > static_cast<size_t>(INT_MAX)) {
+            throw std::runtime_error(file.string() + " is larger than 2 GiB");
+        }
+        corpus.push_back({file.generic_string(), std::move(data)});
+    }
+    return corpus;
+}
+
+// Average duration of `run`, repeated until it took at least `min_time` seconds in total
+template <typename F>
+double seconds_per_run(F &&run, double min_time) {
+    using clock = std::chrono::steady_clock;
+    size_t runs = 1;
+    while (true) {
+        auto start = clock::now();
+        for (size_t i = 0; i < runs; i++) {
+            run();
+        }
+        double elapsed = std::chrono::duration<double>(clock::now() - start).count();
+        if (elapsed >= min_time) {
+            return elapsed / static_cast<double>(runs);
+        }
+        size_t estimate = elapsed > 0 ? static_cast<size_t>(runs * min_time / elapsed * 1.1) : 0;
+        runs = std::max(runs * 2, estimate);
+    }
+}
+
+Result benchmark_file(Codec &codec, const CorpusFile &file, double min_time) {
+    const std::vector<uint8_t> &data = file.data;
+    std::vector<uint8_t> compressed(codec.bound(data.size()));
+    std::vector<uint8_t> decompressed(data.size());
+
+    // First run outside of the measurements, to check the round trip
+    size_t compressed_size = codec.compress(data.data(), data.size(), compressed.data(), compressed.size());
+    codec.decompress(compressed.data(), compressed_size, decompressed.data(), decompressed.size());
+    if (decompressed != data) {
+        throw std::runtime_error("round trip of " + file.path + " does not match the original");
+    }
+
+    Result result;
+    result.file = file.path;
+    result.original_bytes = data.size();
+    result.compressed_bytes = compressed_size;
+    result.compress_seconds = seconds_per_run(
+        [&] { codec.compress(data.data(), data.size(), compressed.data(), compressed.size()); }, min_time);
+    result.decompress_seconds = seconds_per_run(
+        [&] { codec.decompress(compressed.data(), compressed_size, decompressed.data(), decompressed.size()); },
+        min_time);
+    return result;
+}
+
+double megabytes_per_second(size_t bytes, double seconds) {
+    return seconds > 0 ? static_cast<double>(bytes) / seconds / 1e6 : 0;
+}
+
+double ratio(const Result &result) {
+    return result.compressed_bytes ? static_cast<double>(result.original_bytes) / result.compressed_bytes : 0;
+}
+
+std::string csv_field(const std::string &value) {
+    if (value.find_first_of(",\"\n") == std::string::npos) {
+        return value;
+    }
+    std::string quoted = "\"";
+    for (char c : value) {
+        quoted += c == '"' ? std::string("\"\"") : std::string(1, c);
+    }
+    return quoted + "\"";
+}
+
+std::string json_string(const std::string &value) {
+    std::string quoted = "\"";
+    for (unsigned char c : value) {
+        if (c == '"' || c == '\\') {
+            quoted += '\\';
+            quoted += static_cast<char>(c);
+        } else if (c < 0x20) {
+            char escaped[8];
+            std::snprintf(escaped, sizeof(escaped), "\\u%04x", c);
+            quoted += escaped;
+        } else {
+            quoted += static_cast<char>(c);
+        }
+    }
+    return quoted + "\"";
+}
+
+void write_csv(std::ostream &out, const std::vector<Result> &results) {
+    out << "codec,level,file,original_bytes,compressed_bytes,ratio,compress_mb_s,decompress_mb_s\n";
+    char line[256];
+    for (const auto &r : results) {
+        std::snprintf(line, sizeof(line), ",%zu,%zu,%.4f,%.2f,%.2f\n", r.original_bytes, r.compressed_bytes, ratio(r),
+                      megabytes_per_second(r.original_bytes, r.compress_seconds),
+                      megabytes_per_second(r.original_bytes, r.decompress_seconds));
+        out << csv_field(r.codec) << "," << r.level << "," << csv_field(r.file) << line;
+    }
+}
+
+void write_json(std::ostream &out, const std::vector<Result> &results, double min_time) {
+    out << "{\n  \"configuration\": " << BUILD_CONFIGURATION << ",\n  \"min_time\": " << min_time
+        << ",\n  \"results\": [";
+    char numbers[256];
+    for (size_t i = 0; i < results.size(); i++) {
+        const Result &r = results[i];
+        std::snprintf(numbers, sizeof(numbers),
+                      "\"original_bytes\": %zu, \"compressed_bytes\": %zu, \"ratio\": %.4f, "
+                      "\"compress_mb_s\": %.2f, \"decompress_mb_s\": %.2f}",
+                      r.original_bytes, r.compressed_bytes, ratio(r),
+                      megabytes_per_second(r.original_bytes, r.compress_seconds),
+                      megabytes_per_second(r.original_bytes, r.decompress_seconds));
+        out << (i ? ",\n    " : "\n    ") << "{\"codec\": " << json_string(r.codec) << ", \"level\": " << r.level
+            << ", \"file\": " << (r.file.empty() ? "null" : json_string(r.file)) << ", " << numbers;
+    }
+    out << "\n  ]\n}\n";
+}
+
+void print_usage(const char *program, const std::vector<CodecFactory> &codecs) {
+    std::cout << "Usage: " << program << " [options] corpus...\n"
+              << "\n"
+              << "Compresses and decompresses the files of the corpus, directories searched recursively,\n"
+              << "and reports the compression ratio and throughput in MB/s of each codec and level.\n"
+              << "\n"
+              << "Options:\n"
+              << "  -c, --codec NAME[:LEVELS]  codec to run, with comma separated levels, e.g. zstd:1,3,19.\n"
+              << "                             Can be repeated (default: all codecs at their default levels)\n"
+              << "  -f, --format csv|json      output format (default: csv)\n"
+              << "  -o, --output FILE          write the results to FILE instead of stdout\n"
+              << "  -t, --min-time SECONDS     minimum time measuring each codec, level and direction over\n"
+              << "                             the whole corpus (default: 0.5)\n"
+              << "  -j, --threads N            compression threads for codecs supporting them (zstd)\n"
+              << "      --per-file             also report each file, not only the corpus totals\n"
+              << "      --configuration        print the codec packages and options of this build as JSON\n"
+              << "  -h, --help                 show this help\n"
+              << "\n"
+              << "Codecs (default levels):\n";
+    for (const auto &codec : codecs) {
+        std::cout << "  " << codec.name << " (";
+        for (size_t i = 0; i < codec.default_levels.size(); i++) {
+            std::cout << (i ? "," : "") << codec.default_levels[i];
+        }
+        std::cout << ")\n";
+    }
+}
+
+Selection parse_codec(const std::string &argument, const std::vector<CodecFactory> &codecs) {
+    std::string name = argument.substr(0, argument.find(':'));
+    auto found = std::find_if(codecs.begin(), codecs.end(), [&](const CodecFactory &c) { return c.name == name; });
+    if (found == codecs.end()) {
+        throw std::invalid_argument("unknown codec '" + name + "', or not enabled in this build");
+    }
+    Selection selection{&*found, found->default_levels};
+    if (name.size() < argument.size()) {
+        selection.levels.clear();
+        std::stringstream levels(argument.substr(name.size() + 1));
+        std::string level;
+        while (std::getline(levels, level, ',')) {
+            size_t end = 0;
+            try {
+                selection.levels.push_back(std::stoi(level, &end));
+            } catch (const std::logic_error &) {
+                end = std::string::npos;
+            }
+            if (end != level.size()) {
+                throw std::invalid_argument("invalid level '" + level + "' for " + name);
+            }
+        }
+    }
+    return selection;
+}
+
+} // namespace
+
+int main(int argc, char **argv) {
+    std::vector<CodecFactory> codecs = available_codecs();
+    std::vector<Selection> selections;
+    std::vector<std::string> paths;
+    std::string format = "csv";
+    std::string output;
+    double min_time = 0.5;
+    int threads = 0;
+    bool per_file = false;
+
+    try {
+        for (int i = 1; i < argc; i++) {
+            std::string arg = argv[i];
+            auto value = [&]() -> std::string {
+                if (i + 1 >= argc) {
+                    throw std::invalid_argument(arg + " requires a value");
+                }
+                return argv[++i];
+            };
+            if (arg == "-h" || arg == "--help") {
+                print_usage(argv[0], codecs);
+                return 0;
+            } else if (arg == "--configuration") {
+                std::cout << BUILD_CONFIGURATION << "\n";
+                return 0;
+            } else if (arg == "-c" || arg == "--codec") {
+                selections.push_back(parse_codec(value(), codecs));
+            } else if (arg == "-f" || arg == "--format") {
+                format = value();
+                if (format != "csv" && format != "json") {
+                    throw std::invalid_argument("unknown format '" + format + "'");
+                }
+            } else if (arg == "-o" || arg == "--output") {
+                output = value();
+            } else if (arg == "-t" || arg == "--min-time") {
+                min_time = std::stod(value());
+            } else if (arg == "-j" || arg == "--threads") {
+                threads = std::stoi(value());
+            } else if (arg == "--per-file") {
+                per_file = true;
+            } else if (arg.size() > 1 && arg[0] == '-') {
+                throw std::invalid_argument("unknown option " + arg);
+            } else {
+                paths.push_back(arg);
+            }
+        }
+        if (paths.empty()) {
+            throw std::invalid_argument("no corpus given, see --help");
+        }
+    } catch (const std::exception &e) {
+        std::cerr << "error: " << e.what() << "\n";
+        return 2;
+    }
+    if (selections.empty()) {
+        for (const auto &codec : codecs) {
+            selections.push_back({&codec, codec.default_levels});
+        }
+    }
+
+    try {
+        std::vector<CorpusFile> corpus = load_corpus(paths);
+        if (corpus.empty()) {
+            throw std::runtime_error("the corpus has no data");
+        }
+        size_t corpus_bytes = 0;
+        for (const auto &file : corpus) {
+            corpus_bytes += file.data.size();
+        }
+        std::cerr << corpus.size() << " files, " << corpus_bytes << " bytes\n";
+
+        std::vector<Result> results;
+        for (const auto &selection : selections) {
+            for (int level : selection.levels) {
+                std::unique_ptr<Codec> codec = selection.factory->create(level, threads);
+                Result total;
+                total.codec = selection.factory->name;
+                total.level = level;
+                for (const auto &file : corpus) {
+                    // Each file gets its share of the minimum time, by size
+                    double file_min_time = min_time * static_cast<double>(file.data.size()) / corpus_bytes;
+                    Result result = benchmark_file(*codec, file, file_min_time);
+                    result.codec = total.codec;
+                    result.level = level;
+                    total.original_bytes += result.original_bytes;
+                    total.compressed_bytes += result.compressed_bytes;
+                    total.compress_seconds += result.compress_seconds;
+                    total.decompress_seconds += result.decompress_seconds;
+                    if (per_file) {
+                        results.push_back(result);
+                    }
+                }
+                std::fprintf(stderr, "%-10s %3d: ratio %.3f, compress %.1f MB/s, decompress %.1f MB/s\n",
+                             total.codec.c_str(), level, ratio(total),
+                             megabytes_per_second(total.original_bytes, total.compress_seconds),
+                             megabytes_per_second(total.original_bytes, total.decompress_seconds));
+                results.push_back(total);
+            }
+        }
+
+        std::ofstream file;
+        if (!output.empty()) {
+            file.open(output);
+            if (!file) {
+                throw std::runtime_error("cannot write " + output);
+            }
+        }
+        std::ostream &out = output.empty() ? std::cout : file;
+        if (format == "json") {
+            write_json(out, results, min_time);
+        } else {
+            write_csv(out, results);
+        }
+    } catch (const std::exception &e) {
+        std::cerr << "error: " << e.what() << "\n";
+        return 1;
+    }
+    return 0;
+}
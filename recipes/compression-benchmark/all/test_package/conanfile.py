@@ -0,0 +1,17 @@
+from conan import ConanFile
+from conan.tools.build import can_run
+import os
+
+
+class TestPackageConan(ConanFile):
+    settings = "os", "arch", "compiler", "build_type"
+    generators = "VirtualBuildEnv"
+    test_type = "explicit"
+
+    def build_requirements(self):
+        self.tool_requires(self.tested_reference_str)
+
+    def test(self):
+        if can_run(self):
+            # A tiny corpus: this recipe, at a short measuring time
+            self.run(f"compression-benchmark --min-time 0.01 --format json {os.path.abspath(__file__)}")
@@ -1,3 +1,6 @@
+import functools
+import glob
+import json
 import os
 
 from conan import ConanFile
@@ -9,6 +12,9 @@ from conan.tools.files import apply_conandata_patches, copy, export_conandata_pa
 from conan.tools.microsoft import check_min_vs, is_msvc
 from conan.tools.scm import Version
 
+required_conan_version = ">=1.56.0"
+
+
 # Load the generated component dependency information.
 #
 # `google-cloud-cpp` has well over 200 components. Conan cannot use the CMake
@@ -16,14 +22,17 @@ from conan.tools.scm import Version
 # information is error prone and fairly tedious. A helper script in this
 # directory reproduces the algorithms used by `google-cloud-cpp` to generate its
 # dependency information. With each new revision of `google-cloud-cpp` the
-# script will be used to generate a new file with the component dependency
-# information. The expectation is that maintaining this script will be easier
-# than writing long lists of dependencies by hand.
-import components_2_15_1
-import components_2_19_0
-import components_2_28_0
-
-required_conan_version = ">=1.56.0"
+# script will be used to generate a new components_<version>.json file with the
+# component dependency information. The expectation is that maintaining this
+# script will be easier than writing long lists of dependencies by hand.
+#
+# Only the file for the version being used is read, once per process.
+@functools.lru_cache(maxsize=None)
+def _load_components(path):
+    if not os.path.isfile(path):
+        return None
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
 
 
 class GoogleCloudCppConan(ConanFile):
@@ -45,28 +54,10 @@ class GoogleCloudCppConan(ConanFile):
     settings = "os", "arch", "compiler", "build_type"
     options = {"shared": [True, False], "fPIC": [True, False]}
     default_options = {"shared": False, "fPIC": True}
-    exports = ["components_2_15_1.py",
-               "components_2_19_0.py",
-               "components_2_28_0.py",
-               ]
+    exports = ["components_*.json"]
 
     short_paths = True
 
-    _GA_COMPONENTS = {
-        '2.15.1': components_2_15_1.COMPONENTS,
-        '2.19.0': components_2_19_0.COMPONENTS,
-        '2.28.0': components_2_28_0.COMPONENTS,
-    }
-    _PROTO_COMPONENTS = {
-        '2.15.1': components_2_15_1.PROTO_COMPONENTS,
-        '2.19.0': components_2_19_0.PROTO_COMPONENTS,
-        '2.28.0': components_2_28_0.PROTO_COMPONENTS,
-    }
-    _PROTO_COMPONENT_DEPENDENCIES = {
-        "2.15.1": components_2_15_1.DEPENDENCIES,
-        "2.19.0": components_2_19_0.DEPENDENCIES,
-        "2.28.0": components_2_28_0.DEPENDENCIES,
-    }
     # Some components require custom dependency definitions.
     _REQUIRES_CUSTOM_DEPENDENCIES = {
         "bigquery", "bigtable", "iam", "oauth2", "pubsub", "spanner", "storage",
@@ -94,20 +85,11 @@ class GoogleCloudCppConan(ConanFile):
         if is_msvc(self) and self.info.options.shared:
             raise ConanInvalidConfiguration(f"{self.ref} shared not supported by Visual Studio")
 
-        if str(self.version) not in self._GA_COMPONENTS:
-            print(f"{type(self.version)} {self.version}")
-            raise ConanInvalidConfiguration(
-                f"The components are unknown for version {self.version}. Expected one of {self._GA_COMPONENTS.keys()}"
-            )
-
-        if str(self.version) not in self._PROTO_COMPONENTS:
+        if self._components_info is None:
+            known = sorted(os.path.basename(f)[len("components_"):-len(".json")]
+                           for f in glob.glob(os.path.join(self.recipe_folder, "components_*.json")))
             raise ConanInvalidConfiguration(
-                f"The proto components are unknown for version {self.version}. Expected one of {self._PROTO_COMPONENTS.keys()}"
-            )
-
-        if str(self.version) not in self._PROTO_COMPONENT_DEPENDENCIES:
-            raise ConanInvalidConfiguration(
-                f"The inter-component components are unknown for version {self.version}. Expected one of {self._PROTO_COMPONENT_DEPENDENCIES.keys()}"
+                f"The components are unknown for version {self.version}. Expected one of {known}"
             )
 
         if (
@@ -185,8 +167,12 @@ class GoogleCloudCppConan(ConanFile):
         cmake.configure()
         cmake.build()
 
+    @property
+    def _components_info(self):
+        return _load_components(os.path.join(self.recipe_folder, f"components_{self.version}.json"))
+
     def _generate_proto_requires(self, component):
-        deps = self._PROTO_COMPONENT_DEPENDENCIES.get(self.version, dict())
+        deps = self._components_info["DEPENDENCIES"] if self._components_info else dict()
         return deps.get(component, [])
 
     _SKIPPED_COMPONENTS = {
@@ -201,7 +187,7 @@ class GoogleCloudCppConan(ConanFile):
     }
 
     def _components(self):
-        result = self._GA_COMPONENTS.get(str(self.version), []).copy()
+        result = list(self._components_info["COMPONENTS"]) if self._components_info else []
         for c in self._SKIPPED_COMPONENTS:
             result.remove(c)
         # TODO - these do not build on Android due to conflicts between OS
@@ -214,7 +200,7 @@ class GoogleCloudCppConan(ConanFile):
         return result
 
     def _proto_components(self):
-        result = self._PROTO_COMPONENTS.get(self.version, []).copy()
+        result = list(self._components_info["PROTO_COMPONENTS"]) if self._components_info else []
         for c in self._SKIPPED_COMPONENTS:
             result.remove(c + '_protos')
         # TODO - these do not build on Android due to conflicts between OS
@@ -2,7 +2,9 @@
 
 import argparse
 import glob
+import json
 import os
+import sys
 
 """Extract google-cloud-cpp's component dependency info for use in Conan.
 
@@ -229,8 +231,26 @@ def _generate_proto_requires(depfile):
     return list(_PROTO_DEPS_COMMON_REQUIRES) + requires
 
 
+def _write_json(data, f):
+    """Write the component tables as JSON, one dependency entry per line."""
+    f.write("{\n")
+    f.write('  "DEPENDENCIES": {\n')
+    deps = data["DEPENDENCIES"]
+    f.write(",\n".join(f"    {json.dumps(k)}: {json.dumps(v)}" for k, v in deps.items()))
+    f.write("\n  },\n")
+    for i, key in enumerate(["PROTO_COMPONENTS", "COMPONENTS"]):
+        f.write(f"  {json.dumps(key)}: [\n")
+        f.write(",\n".join(f"    {json.dumps(c)}" for c in sorted(data[key])))
+        f.write("\n  ]" + (",\n" if i == 0 else "\n"))
+    f.write("}\n")
+
+
 def main():
-    """Generate a python file representing the google-cloud-cpp proto deps."""
+    """Generate a components_<version>.json file representing the google-cloud-cpp proto deps.
+
+    The recipe loads only the file matching the version being resolved, so keep one
+    JSON file per version instead of importable Python modules.
+    """
     parser = argparse.ArgumentParser(description=(__doc__))
     parser.add_argument(
         "-s",
@@ -240,8 +260,7 @@ def main():
     args = parser.parse_args()
     source_folder = vars(args)["source_folder"]
     deps_folder = os.path.join(source_folder, "external", "googleapis", "protodeps")
-    print("# Automatically generated by %s DO NOT EDIT" % __file__)
-    print("DEPENDENCIES = {")
+    dependencies = {}
     proto_components = _PROTO_BASE_COMPONENTS.copy()
     files = sorted(glob.glob(os.path.join(deps_folder, "*.deps")))
     experimental = set(_experimental_components(source_folder))
@@ -261,24 +280,22 @@ def main():
         deps = _generate_proto_requires(filename)
         proto_components.add(component)
         proto_components.update(deps)
-        print(f'    "{component}": {sorted(deps)},')
+        dependencies[component] = sorted(deps)
     for component in sorted(_HARD_CODED_DEPENDENCIES.keys()):
         deps = _HARD_CODED_DEPENDENCIES[component]
         proto_components.add(component)
         proto_components.update(deps)
-        print(f'    "{component}": {sorted(deps)},')
-    print(f'    "cloud_extended_operations_protos": ["protobuf::libprotobuf"],')
-    print(f'    "compute_protos": ["cloud_extended_operations_protos", "protobuf::libprotobuf"],')
+        dependencies[component] = sorted(deps)
+    dependencies["cloud_extended_operations_protos"] = ["protobuf::libprotobuf"]
+    dependencies["compute_protos"] = ["cloud_extended_operations_protos", "protobuf::libprotobuf"]
     proto_components.add("cloud_extended_operations_protos")
     proto_components.add("compute_protos")
-    print("}")
     proto_components = proto_components - _PROTO_DEPS_COMMON_REQUIRES
-    names = ['"%s"' % c for c in proto_components]
-    joined = ",\n    ".join(sorted(names))
-    print(f"\nPROTO_COMPONENTS = {{\n    {joined}\n}}")
-    names = ['"%s"' % c for c in components]
-    joined = ",\n    ".join(sorted(names))
-    print(f"\nCOMPONENTS = {{\n    {joined}\n}}")
+    _write_json({
+        "DEPENDENCIES": dependencies,
+        "PROTO_COMPONENTS": proto_components,
+        "COMPONENTS": components,
+    }, sys.stdout)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,169 @@
+# Shared parser for the proto rules of Bazel BUILD files.
+#
+# The same file is used by the `googleapis` and `grpc-proto` recipes. Recipes cannot import
+# code from each other, so this copy in `googleapis` is the reference and the one in
+# `grpc-proto` must stay byte-identical: tools/test_bazel_proto.py checks it.
+import ast
+import hashlib
+import json
+import os
+
+PROTO_RULES = ("proto_library", "cc_proto_library")
+
+
+class BuildFileError(Exception):
+    pass
+
+
+def _evaluate(node, variables, filename):
+    """Evaluate the subset of Starlark used by the arguments of proto rules"""
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return node.value
+    if isinstance(node, (ast.List, ast.Tuple)):
+        result = []
+        for item in node.elts:
+            value = _evaluate(item, variables, filename)
+            result.extend(value if isinstance(value, list) else [value])
+        return result
+    if isinstance(node, ast.Name):
+        if node.id not in variables:
+            raise BuildFileError(f"{filename}:{node.lineno}: unknown variable '{node.id}'")
+        return variables[node.id]
+    if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Add):
+        return _evaluate(node.left, variables, filename) + _evaluate(node.right, variables, filename)
+    if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id == "select":
+        # Without a Bazel configuration, use the default branch, or all branches if there is none
+        branches = node.args[0]
+        if not isinstance(branches, ast.Dict):
+            raise BuildFileError(f"{filename}:{node.lineno}: unsupported select() argument")
+        result = []
+        for key, value in zip(branches.keys, branches.values):
+            if isinstance(key, ast.Constant) and key.value == "//conditions:default":
+                return _evaluate(value, variables, filename)
+            result.extend(_evaluate(value, variables, filename))
+        return result
+    raise BuildFileError(f"{filename}:{node.lineno}: unsupported expression '{ast.dump(node)}'")
+
+
+def parse_build_file(content, filename="BUILD.bazel", error=None):
+    """
+    Return the proto rules declared in the content of a BUILD file, as dicts with the keys
+    `kind`, `name`, `srcs` and `deps`. Labels are returned as written in the file.
+
+    Starlark syntax is a subset of Python's, so the file is parsed with `ast`: lists spanning
+    several lines, comments, concatenation with variables and `select()` are all supported.
+
+    Unsupported constructs raise BuildFileError, unless an `error` callback is given: it is then
+    called with the message, and the rule (or the whole file for a syntax error) is skipped.
+    """
+    def report(e):
+        if error is None:
+            raise e
+        error(str(e))
+
+    try:
+        tree = ast.parse(content, filename=filename)
+    except SyntaxError as e:
+        report(BuildFileError(f"{filename}: {e}"))
+        return []
+
+    variables = {}
+    rules = []
+    for statement in tree.body:
+        if isinstance(statement, ast.Assign) and len(statement.targets) == 1 and isinstance(statement.targets[0], ast.Name):
+            try:
+                variables[statement.targets[0].id] = _evaluate(statement.value, variables, filename)
+            except BuildFileError:
+                # Variables not used by proto rules may hold anything
+                pass
+        elif isinstance(statement, ast.Expr) and isinstance(statement.value, ast.Call):
+            call = statement.value
+            if not isinstance(call.func, ast.Name) or call.func.id not in PROTO_RULES:
+                continue
+            arguments = {keyword.arg: keyword.value for keyword in call.keywords}
+            try:
+                if "name" not in arguments:
+                    raise BuildFileError(f"{filename}:{call.lineno}: {call.func.id}() without a name")
+                rules.append({
+                    "kind": call.func.id,
+                    "name": _evaluate(arguments["name"], variables, filename),
+                    "srcs": _evaluate(arguments["srcs"], variables, filename) if "srcs" in arguments else [],
+                    "deps": _evaluate(arguments["deps"], variables, filename) if "deps" in arguments else [],
+                })
+            except BuildFileError as e:
+                report(e)
+    return rules
+
+
+class ParseCache:
+    """
+    Parsed rules of BUILD files keyed by the sha256 of their content, persisted as a JSON file.
+    Unchanged files are not parsed again, whatever their location. Files with errors are not
+    cached, so their errors are reported again by the next parse.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.entries = {}
+        self.hits = 0
+        self.misses = 0
+        self._dirty = False
+        if path and os.path.isfile(path):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    self.entries = json.load(f)
+            except ValueError:
+                self.entries = {}
+
+    def rules(self, filename, error=None):
+        with open(filename, "rb") as f:
+            content = f.read()
+        key = hashlib.sha256(content).hexdigest()
+        if key in self.entries:
+            self.hits += 1
+            return self.entries[key]
+        self.misses += 1
+        errors = []
+        rules = parse_build_file(content.decode("utf-8"), filename, errors.append if error else None)
+        for message in errors:
+            error(message)
+        if not errors:
+            self.entries[key] = rules
+            self._dirty = True
+        return rules
+
+    def save(self):
+        if self.path and self._dirty:
+            with open(self.path, "w", encoding="utf-8") as f:
+                json.dump(self.entries, f, separators=(",", ":"))
+            self._dirty = False
+
+
+def mark_used(proto_libraries, key, external_deps):
+    """Mark every library the used ones depend on as used, visiting each library once"""
+    all_dict = {key(it): it for it in proto_libraries}
+    pending = [it for it in proto_libraries if it.is_used]
+    while pending:
+        proto_library = pending.pop()
+        for it_dep in proto_library.deps:
+            if it_dep in external_deps or all_dict[it_dep].is_used:
+                continue
+            all_dict[it_dep].is_used = True
+            pending.append(all_dict[it_dep])
+    return all_dict
+
+
+if __name__ == "__main__":
+    # Benchmark: python bazel_proto.py <source folder> [cache file]
+    import glob
+    import sys
+    import time
+
+    files = glob.glob(os.path.join(sys.argv[1], "**", "BUILD.bazel"), recursive=True)
+    cache = ParseCache(sys.argv[2] if len(sys.argv) > 2 else None)
+    start = time.perf_counter()
+    count = sum(len(cache.rules(filename)) for filename in files)
+    elapsed = time.perf_counter() - start
+    cache.save()
+    print(f"{len(files)} BUILD files, {count} proto rules in {elapsed * 1000:.0f} ms "
+          f"({cache.hits} cache hits, {cache.misses} parsed)")
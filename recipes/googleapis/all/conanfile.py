@@ -1,9 +1,10 @@
 import functools
 import glob
+import json
 import os
 
 from conan import ConanFile
-from conan.errors import ConanInvalidConfiguration
+from conan.errors import ConanException, ConanInvalidConfiguration
 from conan.tools.build import check_min_cppstd
 from conan.tools.cmake import CMake, CMakeDeps, CMakeToolchain, cmake_layout
 from conan.tools.env import VirtualBuildEnv, VirtualRunEnv
@@ -11,7 +12,8 @@ from conan.tools.files import apply_conandata_patches, copy, export_conandata_pa
 from conan.tools.microsoft import is_msvc
 from conan.tools.scm import Version
 
-from helpers import parse_proto_libraries
+from bazel_proto import ParseCache, mark_used
+from helpers import parse_proto_libraries, _ProtoLibrary
 
 required_conan_version = ">=1.60.0 <2 || >=2.0.5"
 
@@ -28,12 +30,17 @@ class GoogleAPIS(ConanFile):
     options = {
         "shared": [True, False],
         "fPIC": [True, False],
+        # Comma-separated list of the C++ proto libraries to build, either as Bazel labels
+        # (e.g. "//google/pubsub/v1:pubsub_cc_proto") or as packages (e.g. "google/pubsub/v1", all
+        # C++ libraries in it). Their dependencies are built as well. All libraries are built if not set.
+        "components": [None, "ANY"],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
+        "components": None,
     }
-    exports = "helpers.py"
+    exports = "helpers.py", "bazel_proto.py"
     short_paths = True
 
     @property
@@ -78,8 +85,22 @@ class GoogleAPIS(ConanFile):
         # CMake >= 3.20 is required. There is a proto with dots in the name 'k8s.min.proto' and CMake fails to generate project files
         self.tool_requires("cmake/[>=3.20 <4]")
 
+    @property
+    def _build_files(self):
+        for folder in ("google", "grafeas"):
+            yield from glob.iglob(os.path.join(self.source_folder, folder, '**', 'BUILD.bazel'), recursive=True)
+
+    @property
+    def _parse_cache_file(self):
+        return os.path.join(self.source_folder, "bazel_proto_cache.json")
+
     def source(self):
         get(self, **self.conan_data["sources"][str(self.version)], strip_root=True)
+        # Parse the BUILD files once per source revision: builds only parse the files changed by patches
+        cache = ParseCache(self._parse_cache_file)
+        for filename in self._build_files:
+            cache.rules(filename, self.output.error)
+        cache.save()
 
     def generate(self):
         VirtualBuildEnv(self).generate()
@@ -90,34 +111,87 @@ class GoogleAPIS(ConanFile):
         deps = CMakeDeps(self)
         deps.generate()
 
-    @functools.lru_cache(1)
-    def _parse_proto_libraries(self):
+    @property
+    def _proto_libraries_file(self):
+        return os.path.join(self.build_folder, "proto_libraries.json")
+
+    @property
+    def _build_files_fingerprint(self):
+        """Paths, sizes and modification times of the BUILD files: they change whenever a BUILD file does"""
+        fingerprint = []
+        for filename in sorted(self._build_files):
+            stat = os.stat(filename)
+            fingerprint.append([os.path.relpath(filename, self.source_folder).replace("\\", "/"), stat.st_size, stat.st_mtime_ns])
+        return fingerprint
+
+    def _load_proto_graph(self):
+        """
+        The validated proto library graph, before applying the `components` selection and the tweaks
+        for the current settings. It is parsed once per build folder and reused by later steps
+        (package, repeated `conan build`) as long as the BUILD files are unchanged.
+        """
+        fingerprint = self._build_files_fingerprint
+        if os.path.isfile(self._proto_libraries_file):
+            with open(self._proto_libraries_file, "r", encoding="utf-8") as f:
+                cached = json.load(f)
+            if cached.get("fingerprint") == fingerprint:
+                return [_ProtoLibrary.from_dict(it) for it in cached["libraries"]]
+        proto_libraries = self._parse_proto_graph_from_sources()
+        with open(self._proto_libraries_file, "w", encoding="utf-8") as f:
+            json.dump({"fingerprint": fingerprint, "libraries": [it.to_dict() for it in proto_libraries]}, f, separators=(",", ":"))
+        return proto_libraries
+
+    @property
+    def _selected_components(self):
+        """The labels and packages requested in the `components` option, or None to build everything"""
+        if not self.options.components:
+            return None
+        selected = set()
+        for item in str(self.options.components).split(","):
+            item = item.strip().rstrip("/")
+            if not item:
+                continue
+            if ":" in item:
+                selected.add(item if item.startswith("//") else f"//{item}")
+            else:
+                selected.add(item[2:] if item.startswith("//") else item)
+        return selected
+
+    def _parse_proto_graph_from_sources(self):
         # Generate the libraries to build dynamically
+        cache = ParseCache(self._parse_cache_file)
         proto_libraries = []
-        for filename in glob.iglob(os.path.join(self.source_folder, 'google', '**', 'BUILD.bazel'), recursive=True):
-            proto_libraries += parse_proto_libraries(filename, self.source_folder, self.output.error)
-
-        for filename in glob.iglob(os.path.join(self.source_folder, 'grafeas', '**', 'BUILD.bazel'), recursive=True):
-            proto_libraries += parse_proto_libraries(filename, self.source_folder, self.output.error)
+        for filename in self._build_files:
+            proto_libraries += parse_proto_libraries(filename, self.source_folder, self.output.error, cache)
+        self.output.info(f"Parsed {cache.misses} BUILD files ({cache.hits} cached)")
 
         # Validate that all files exist and all dependencies are found
-        all_deps = [f"{it.qname}:{it.name}" for it in proto_libraries]
-        all_deps += ["protobuf::libprotobuf"]
+        all_dict = {it.key: it for it in proto_libraries}
+        all_deps = set(all_dict)
+        all_deps.add("protobuf::libprotobuf")
         for it in proto_libraries:
             it.validate(self.source_folder, all_deps)
+        return proto_libraries
 
-        # Mark the libraries we need recursively (C++ context)
-        all_dict = {f"{it.qname}:{it.name}": it for it in proto_libraries}
+    @functools.lru_cache(1)
+    def _parse_proto_libraries(self):
+        proto_libraries = self._load_proto_graph()
+        all_dict = {it.key: it for it in proto_libraries}
 
-        def activate_library(proto_library):
-            proto_library.is_used = True
-            for it_dep in proto_library.deps:
-                if it_dep == "protobuf::libprotobuf":
-                    continue
-                activate_library(all_dict[it_dep])
+        # Restrict the C++ libraries to the requested components, if any
+        selected = self._selected_components
+        if selected is not None:
+            matched = set()
+            for it in filter(lambda u: u.is_cc, proto_libraries):
+                matches = selected.intersection([it.key, it.qname[2:]])
+                it.is_used = bool(matches)
+                matched.update(matches)
+            unknown = selected - matched
+            if unknown:
+                raise ConanException(f"{self.ref}: no C++ proto library found for components: {', '.join(sorted(unknown))}")
 
-        for it in filter(lambda u: u.is_used, proto_libraries):
-            activate_library(it)
+        # Mark the libraries we need, following dependencies from the C++ ones (each library is visited once)
+        mark_used(proto_libraries, lambda u: u.key, ["protobuf::libprotobuf"])
 
         # Tweaks
         def deactivate_library(key):
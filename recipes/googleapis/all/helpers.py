@@ -1,7 +1,8 @@
 import os
-import re
 import textwrap
 
+from bazel_proto import ParseCache
+
 class _ProtoLibrary:
     name: str = None
     qname: str = None
@@ -34,6 +35,30 @@ class _ProtoLibrary:
             "is_cc": self.is_cc,
         }, indent=4)
 
+    @property
+    def key(self):
+        return f"{self.qname}:{self.name}"
+
+    def to_dict(self):
+        return {
+            "name": self.name,
+            "qname": self.qname,
+            "srcs": self.srcs,
+            "deps": sorted(self.deps),
+            "is_cc": self.is_cc,
+            "is_used": self.is_used,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        proto_library = cls(is_cc=data["is_cc"])
+        proto_library.name = data["name"]
+        proto_library.qname = data["qname"]
+        proto_library.srcs = data["srcs"]
+        proto_library.deps = set(data["deps"])
+        proto_library.is_used = data["is_used"]
+        return proto_library
+
     @property
     def cmake_target(self):
         qname = self.qname
@@ -95,96 +120,31 @@ class _ProtoLibrary:
 
         return content
 
-def parse_proto_libraries(filename, source_folder, error):
+def parse_proto_libraries(filename, source_folder, error, cache=None):
     # Generate the libraries to build dynamically
-    re_name = re.compile(r'name = "(.*)"')
-    re_srcs_oneline = re.compile(r'srcs = \["(.*)"\],')
-    re_deps_oneline = re.compile(r'deps = \["(.*)"\],')
-    re_add_varname = re.compile(r'] \+ (.*),')
-
-    proto_libraries = []
+    rules = (cache or ParseCache(None)).rules(filename, error)
 
     basedir = os.path.dirname(filename)
     current_folder_str = os.path.relpath(basedir, source_folder).replace('\\', '/')  # We need forward slashes because of Windows
-    proto_library = None
-
-    def parsing_sources(line):
-        proto_path = os.path.relpath(os.path.join(basedir, line.strip(",").strip("\"")), source_folder).replace('\\', '/')
-        proto_library.srcs.append(proto_path)
-
-    def parsing_deps(line):
-        # Remove any comments
-        line = line.split('#', 1)[0].strip()
-        line = line.strip(",").strip("\"")
-        if line == '':
-            pass
-        elif line.startswith("@com_google_protobuf//:"):
-            proto_library.deps.add("protobuf::libprotobuf")
-        elif line.startswith("@com_google_googleapis//"):
-            proto_library.deps.add(line[len("@com_google_googleapis"):])
-        elif line.startswith(":"):
-            proto_library.deps.add(f"//{current_folder_str}{line}")
-        elif line.startswith("//google/"):
-            proto_library.deps.add(line)
-        elif line.startswith("//grafeas/"):
-            proto_library.deps.add(line)
-        else:
-            error(f"Unrecognized dep: {line} -- {os.path.relpath(filename, source_folder)}")
-
-    def collecting_items(collection, line):
-        line = line.strip(",").strip("\"")
-        collection.append(line)
-
-    with open(filename, 'r', encoding='utf-8') as f:
-        action = None
-        parsing_variable = None
-        variables = {}
-        for line in f.readlines():
-            line = line.strip()
-
-            if line == "proto_library(":
-                assert proto_library == None
-                proto_library = _ProtoLibrary(is_cc=False)
-            elif line == "cc_proto_library(":
-                assert proto_library == None
-                proto_library = _ProtoLibrary(is_cc=True)
-            elif line == '_PROTO_SUBPACKAGE_DEPS = [':
-                variables["_PROTO_SUBPACKAGE_DEPS"] = []
-                parsing_variable = lambda u: collecting_items(variables["_PROTO_SUBPACKAGE_DEPS"], u)
-            elif parsing_variable != None:
-                if line == "]":
-                    parsing_variable = None
-                else:
-                    parsing_variable(line)
-            elif proto_library != None:
-                if line.startswith("name ="):
-                    proto_library.name = re_name.search(line).group(1)
-                    proto_library.qname = f"//{current_folder_str}"
-                elif line.startswith("srcs = "):
-                    m = re_srcs_oneline.search(line)
-                    if m:
-                        parsing_sources(m.group(1))
-                    else:
-                        action = parsing_sources
-                elif line.startswith("deps = "):
-                    m = re_deps_oneline.search(line)
-                    if m:
-                        parsing_deps(m.group(1))
-                    else:
-                        action = parsing_deps
-                elif line.startswith("visibility = "):
-                    pass
-                elif line == ")":
-                    proto_libraries.append(proto_library)
-                    proto_library = None
-                    action = None
-                elif line == "],":
-                    action = None
-                elif line.startswith("] + "):
-                    varname = re_add_varname.search(line).group(1)
-                    for it in variables[varname]:
-                        action(it)
-                elif action:
-                    action(line)
 
+    def to_dep(label):
+        if label.startswith("@com_google_protobuf//:"):
+            return "protobuf::libprotobuf"
+        elif label.startswith("@com_google_googleapis//"):
+            return label[len("@com_google_googleapis"):]
+        elif label.startswith(":"):
+            return f"//{current_folder_str}{label}"
+        elif label.startswith("//google/") or label.startswith("//grafeas/"):
+            return label
+        error(f"Unrecognized dep: {label} -- {os.path.relpath(filename, source_folder)}")
+        return None
+
+    proto_libraries = []
+    for rule in rules:
+        proto_library = _ProtoLibrary(is_cc=rule["kind"] == "cc_proto_library")
+        proto_library.name = rule["name"]
+        proto_library.qname = f"//{current_folder_str}"
+        proto_library.srcs = [os.path.relpath(os.path.join(basedir, it), source_folder).replace('\\', '/') for it in rule["srcs"]]
+        proto_library.deps.update(filter(None, map(to_dep, rule["deps"])))
+        proto_libraries.append(proto_library)
     return proto_libraries
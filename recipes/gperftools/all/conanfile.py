@@ -35,8 +35,10 @@ class GperftoolsConan(ConanFile):
         "enable_libunwind": [True, False],
         "enable_stacktrace_via_backtrace": [None, True, False],
         "sized_delete": [True, False],
-        "tcmalloc_alignment": [None, "ANY"],
-        "tcmalloc_pagesize": [None, "ANY"],
+        # Minimum alignment of allocations, in bytes
+        "tcmalloc_alignment": [None, 8, 16],
+        # Internal page size in KiB, larger pages trade memory for allocation speed
+        "tcmalloc_pagesize": [None, 4, 8, 16, 32, 64, 128, 256],
     }
     default_options = {
         "shared": False,
@@ -79,7 +81,7 @@ class GperftoolsConan(ConanFile):
 
     @property
     def _build_minimal(self):
-        # Corresponds to the gperftools build_minimal option
+        # Corresponds to the gperftools build_minimal option: tcmalloc_minimal only, the default
         return not (
             self.options.build_cpu_profiler
             or self.options.build_heap_profiler
@@ -156,8 +158,10 @@ class GperftoolsConan(ConanFile):
                 "enable_stacktrace_via_backtrace", False
             )
             args["enable-emergency-malloc"] = self.options.emergency_malloc
-        args["with-tcmalloc-alignment"] = self.options.tcmalloc_alignment
-        args["with-tcmalloc-pagesize"] = self.options.tcmalloc_pagesize
+        if self.options.tcmalloc_alignment:
+            args["with-tcmalloc-alignment"] = str(self.options.tcmalloc_alignment)
+        if self.options.tcmalloc_pagesize:
+            args["with-tcmalloc-pagesize"] = str(self.options.tcmalloc_pagesize)
 
         # Based on https://github.com/conan-io/conan-center-index/blob/c647b1/recipes/libx264/all/conanfile.py#L94
         if is_apple_os(self) and self.settings.arch == "armv8":
@@ -0,0 +1,60 @@
+#include <gperftools/malloc_extension_c.h>
+
+#include <stdint.h>
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <time.h>
+
+// Small-object allocation throughput. A single run compares nothing: run the test package
+// of builds with different tcmalloc_pagesize values and compare their results, each line
+// includes the page size of the build.
+
+#define BATCH 10000
+
+static double now_seconds(void) {
+    struct timespec ts;
+    timespec_get(&ts, TIME_UTC);
+    return ts.tv_sec + ts.tv_nsec / 1e9;
+}
+
+// Page size in bytes, as reported by the "MALLOC: <size> Tcmalloc page size" statistics line, or 0
+static size_t page_size(void) {
+    static char stats[16384];
+    size_t size = 0;
+    MallocExtension_GetStats(stats, sizeof(stats));
+    for (char *line = strtok(stats, "\n"); line != NULL; line = strtok(NULL, "\n")) {
+        if (strstr(line, "page size") != NULL && sscanf(line, "MALLOC: %zu", &size) == 1) {
+            break;
+        }
+    }
+    return size;
+}
+
+int main(int argc, char **argv) {
+    size_t rounds = argc > 1 ? strtoul(argv[1], NULL, 10) : 200;
+    const size_t sizes[] = {16, 32, 64, 128, 256, 1024};
+    static void *blocks[BATCH];
+
+    size_t page_kib = page_size() / 1024;
+    for (size_t s = 0; s < sizeof(sizes) / sizeof(sizes[0]); s++) {
+        // Allocating whole batches before freeing them makes tcmalloc go past the
+        // thread cache to the central free lists and the page heap.
+        double start = now_seconds();
+        for (size_t round = 0; round < rounds; round++) {
+            for (size_t i = 0; i < BATCH; i++) {
+                blocks[i] = malloc(sizes[s]);
+                if (blocks[i] == NULL) {
+                    abort();
+                }
+                *(volatile char *)blocks[i] = (char)i;
+            }
+            for (size_t i = 0; i < BATCH; i++) {
+                free(blocks[i]);
+            }
+        }
+        double elapsed = now_seconds() - start;
+        printf("%3zu KiB pages, %5zu bytes: %.1f Mops/s\n", page_kib, sizes[s], 2.0 * rounds * BATCH / elapsed / 1e6);
+    }
+    return 0;
+}
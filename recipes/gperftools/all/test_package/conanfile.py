@@ -23,3 +23,4 @@ class TestPackageConan(ConanFile):
         if can_run(self):
             bin_path = os.path.join(self.cpp.build.bindir, "test_package")
             self.run(bin_path, env="conanrun")
+            self.run(os.path.join(self.cpp.build.bindir, "benchmark"), env="conanrun")
@@ -9,6 +9,7 @@ from conan.tools.env import VirtualBuildEnv, VirtualRunEnv
 from conan.tools.files import get, collect_libs, copy
 from conan.tools.scm import Version
 
+from bazel_proto import ParseCache, mark_used
 from helpers import parse_proto_libraries
 
 required_conan_version = ">=1.60.0 <2.0 || >=2.0.5"
@@ -31,7 +32,7 @@ class GRPCProto(ConanFile):
         "shared": False,
         "fPIC": True,
     }
-    exports = "helpers.py"
+    exports = "helpers.py", "bazel_proto.py"
 
     @property
     def _is_legacy_one_profile(self):
@@ -78,8 +79,16 @@ class GRPCProto(ConanFile):
         if not self._is_legacy_one_profile:
             self.tool_requires("protobuf/<host_version>")
 
+    @property
+    def _parse_cache_file(self):
+        return os.path.join(self.source_folder, "bazel_proto_cache.json")
+
     def source(self):
         get(self, **self.conan_data["sources"][self.version], strip_root=True)
+        # Parse BUILD.bazel once per source revision, builds reuse the result
+        cache = ParseCache(self._parse_cache_file)
+        cache.rules(os.path.join(self.source_folder, "BUILD.bazel"), self.output.error)
+        cache.save()
 
     def generate(self):
         env = VirtualBuildEnv(self)
@@ -97,25 +106,17 @@ class GRPCProto(ConanFile):
     @functools.lru_cache(1)
     def _parse_proto_libraries(self):
         # Generate the libraries to build dynamically
-        proto_libraries = parse_proto_libraries(os.path.join(self.source_folder, 'BUILD.bazel'), self.source_folder, self.output.error)
+        proto_libraries = parse_proto_libraries(os.path.join(self.source_folder, 'BUILD.bazel'), self.source_folder, self.output.error,
+                                                ParseCache(self._parse_cache_file))
 
         # Validate that all files exist and all dependencies are found
-        all_deps = [it.cmake_target for it in proto_libraries]
-        all_deps += ["googleapis::googleapis", "protobuf::libprotobuf"]
+        external_deps = ["googleapis::googleapis", "protobuf::libprotobuf"]
+        all_deps = set(it.cmake_target for it in proto_libraries).union(external_deps)
         for it in proto_libraries:
             it.validate(self.source_folder, all_deps)
 
         # Mark the libraries we need recursively (C++ context)
-        all_dict = {it.cmake_target: it for it in proto_libraries}
-        def activate_library(proto_library):
-            proto_library.is_used = True
-            for it_dep in proto_library.deps:
-                if it_dep in ["googleapis::googleapis", "protobuf::libprotobuf"]:
-                    continue
-                activate_library(all_dict[it_dep])
-
-        for it in filter(lambda u: u.is_used, proto_libraries):
-            activate_library(it)
+        mark_used(proto_libraries, lambda u: u.cmake_target, external_deps)
 
         return proto_libraries
 
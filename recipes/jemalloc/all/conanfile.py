@@ -7,6 +7,7 @@ from conan.tools.files import export_conandata_patches, apply_conandata_patches,
 from conan.tools.microsoft import is_msvc, is_msvc_static_runtime
 from conan.tools.scm import Version
 import os
+import re
 import shutil
 
 required_conan_version = ">=1.54.0"
@@ -35,6 +36,14 @@ class JemallocConan(ConanFile):
         "enable_initial_exec_tls": [True, False],
         "enable_libdl": [True, False],
         "enable_prof": [True, False],
+        # Base 2 logarithms of the system page size, huge page size and size class quantum,
+        # e.g. lg_page=16 for 64 KiB pages or lg_hugepage=21 for 2 MiB huge pages
+        "lg_page": [None, "ANY"],
+        "lg_hugepage": [None, "ANY"],
+        "lg_quantum": [None, "ANY"],
+        # Options built into the library, e.g. "background_thread:true,dirty_decay_ms:5000",
+        # applied before the MALLOC_CONF environment variable
+        "malloc_conf": [None, "ANY"],
     }
     default_options = {
         "shared": False,
@@ -50,6 +59,10 @@ class JemallocConan(ConanFile):
         "enable_initial_exec_tls": True,
         "enable_libdl": True,
         "enable_prof": False,
+        "lg_page": None,
+        "lg_hugepage": None,
+        "lg_quantum": None,
+        "malloc_conf": None,
     }
 
     @property
@@ -64,6 +77,14 @@ class JemallocConan(ConanFile):
             "msvc": "191",
         }
 
+    @property
+    def _lg_options_ranges(self):
+        return {
+            "lg_page": (12, 16),  # 4 KiB to 64 KiB
+            "lg_hugepage": (16, 30),  # 64 KiB to 1 GiB
+            "lg_quantum": (3, 8),
+        }
+
     @property
     def _settings_build(self):
         return getattr(self, "settings_build", self.settings)
@@ -120,7 +141,17 @@ class JemallocConan(ConanFile):
             if self.options.enable_cxx and self.settings.compiler.get_safe("libcxx") == "libc++" and \
                     Version(self.settings.compiler.version) < "10":
                 raise ConanInvalidConfiguration("Clang 9 or earlier with libc++ is not supported due to the missing mutex implementation.")
-        # 3: Apple Silicon specific checks
+        # 3. Size options and built-in configuration
+        for option, (minimum, maximum) in self._lg_options_ranges.items():
+            value = self.options.get_safe(option)
+            if value and not (str(value).isdigit() and minimum <= int(value) <= maximum):
+                raise ConanInvalidConfiguration(f"{option} must be an integer between {minimum} and {maximum}, not '{value}'")
+        if self.options.lg_page and self.options.lg_hugepage and int(self.options.lg_hugepage) < int(self.options.lg_page):
+            raise ConanInvalidConfiguration("lg_hugepage must not be smaller than lg_page")
+        if self.options.malloc_conf and not re.fullmatch(r"\w+:[^,\s]+(,\w+:[^,\s]+)*", str(self.options.malloc_conf)):
+            raise ConanInvalidConfiguration(f"malloc_conf must be a list of comma separated 'option:value' pairs, "
+                                            f"not '{self.options.malloc_conf}'")
+        # 4. Apple Silicon specific checks
         if self.settings.os == "Macos" and self.settings.arch == "armv8":
             if Version(self.version) < "5.3.0":
                 raise ConanInvalidConfiguration("Support for Apple Silicon is only available as of 5.3.0.")
@@ -147,6 +178,11 @@ class JemallocConan(ConanFile):
             enable_disable("libdl", self.options.enable_libdl),
             enable_disable("prof", self.options.enable_prof),
         ])
+        for option in self._lg_options_ranges:
+            if self.options.get_safe(option):
+                tc.configure_args.append(f"--with-{option.replace('_', '-')}={self.options.get_safe(option)}")
+        if self.options.malloc_conf:
+            tc.configure_args.append(f"--with-malloc-conf={self.options.malloc_conf}")
         env = tc.environment()
         if is_msvc(self):
             # Do not check whether the math library exists when compiled by MSVC
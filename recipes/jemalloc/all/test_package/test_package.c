@@ -1,19 +1,137 @@
 #include <jemalloc/jemalloc.h>
 
+#include <stdbool.h>
+#include <stdint.h>
+#include <stdio.h>
 #include <stdlib.h>
+#include <time.h>
 
-void do_something(size_t i) {
-    // Leak some memory.
-    malloc(i * 100);
+#ifdef _WIN32
+#include <windows.h>
+#else
+#include <pthread.h>
+#endif
+
+#define MAX_THREADS 64
+#define LIVE_ALLOCATIONS 1024
+
+typedef struct {
+    unsigned seed;
+    size_t iterations;
+} worker_args;
+
+static double now_seconds(void) {
+    struct timespec ts;
+    timespec_get(&ts, TIME_UTC);
+    return ts.tv_sec + ts.tv_nsec / 1e9;
+}
+
+// Keeps a ring of live allocations of 8 to 4096 bytes, freeing the oldest one
+// before each new allocation, so that both malloc and free hit the thread caches
+// and the arenas.
+#ifdef _WIN32
+static DWORD WINAPI worker(LPVOID arg) {
+#else
+static void *worker(void *arg) {
+#endif
+    worker_args *args = arg;
+    void *live[LIVE_ALLOCATIONS] = {0};
+    uint32_t state = args->seed;
+    for (size_t i = 0; i < args->iterations; i++) {
+        state = state * 1664525u + 1013904223u;
+        size_t size = 8 + (state >> 8) % 4089;
+        size_t slot = i % LIVE_ALLOCATIONS;
+        free(live[slot]);
+        live[slot] = malloc(size);
+        if (live[slot] == NULL) {
+            abort();
+        }
+        ((char *)live[slot])[0] = (char)i;
+    }
+    for (size_t i = 0; i < LIVE_ALLOCATIONS; i++) {
+        free(live[i]);
+    }
+    return 0;
 }
 
-int main() {
-    for (size_t i = 0; i < 1000; i++) {
-        do_something(i);
+static void print_option(const char *name, char type) {
+    union {
+        bool b;
+        unsigned u;
+        intptr_t z; // ssize_t
+        size_t s;
+        const char *str;
+    } value;
+    size_t size;
+    switch (type) {
+        case 'b': size = sizeof(value.b); break;
+        case 'u': size = sizeof(value.u); break;
+        case 'z': size = sizeof(value.z); break;
+        case 's': size = sizeof(value.s); break;
+        default: size = sizeof(value.str); break;
     }
+    if (mallctl(name, &value, &size, NULL, 0) != 0) {
+        printf("  %-22s (unavailable)\n", name);
+        return;
+    }
+    switch (type) {
+        case 'b': printf("  %-22s %s\n", name, value.b ? "true" : "false"); break;
+        case 'u': printf("  %-22s %u\n", name, value.u); break;
+        case 'z': printf("  %-22s %lld\n", name, (long long)value.z); break;
+        case 's': printf("  %-22s %zu\n", name, value.s); break;
+        default: printf("  %-22s %s\n", name, value.str ? value.str : "(none)"); break;
+    }
+}
+
+int main(int argc, char **argv) {
+    int threads = argc > 1 ? atoi(argv[1]) : 4;
+    size_t iterations = argc > 2 ? strtoul(argv[2], NULL, 10) : 200000;
+    if (threads < 1 || threads > MAX_THREADS) {
+        fprintf(stderr, "usage: %s [threads (1-%d)] [iterations per thread]\n", argv[0], MAX_THREADS);
+        return 1;
+    }
+
+    // Options set at build time (malloc_conf, lg_page, ...) and through MALLOC_CONF
+    printf("jemalloc configuration:\n");
+    print_option("config.malloc_conf", 'c');
+    print_option("arenas.page", 's');
+    print_option("arenas.quantum", 's');
+    print_option("opt.narenas", 'u');
+    print_option("opt.tcache", 'b');
+    print_option("opt.background_thread", 'b');
+    print_option("opt.dirty_decay_ms", 'z');
+    print_option("opt.muzzy_decay_ms", 'z');
+    print_option("opt.percpu_arena", 'c');
+    print_option("opt.thp", 'c');
 
-    // Dump allocator statistics to stderr.
-    malloc_stats_print(NULL, NULL, NULL);
+    worker_args args[MAX_THREADS];
+#ifdef _WIN32
+    HANDLE handles[MAX_THREADS];
+#else
+    pthread_t handles[MAX_THREADS];
+#endif
+    double start = now_seconds();
+    for (int i = 0; i < threads; i++) {
+        args[i].seed = 12345u + i;
+        args[i].iterations = iterations;
+#ifdef _WIN32
+        handles[i] = CreateThread(NULL, 0, worker, &args[i], 0, NULL);
+#else
+        pthread_create(&handles[i], NULL, worker, &args[i]);
+#endif
+    }
+    for (int i = 0; i < threads; i++) {
+#ifdef _WIN32
+        WaitForSingleObject(handles[i], INFINITE);
+        CloseHandle(handles[i]);
+#else
+        pthread_join(handles[i], NULL);
+#endif
+    }
+    double elapsed = now_seconds() - start;
 
+    double operations = 2.0 * threads * iterations;
+    printf("%d threads, %zu malloc/free pairs each: %.3f s, %.1f Mops/s\n",
+           threads, iterations, elapsed, operations / elapsed / 1e6);
     return 0;
 }
@@ -28,6 +28,9 @@ class MimallocConan(ConanFile):
         "override": [True, False],
         "inject": [True, False],
         "single_object": [True, False],
+        "padding": [True, False],
+        "opt_arch": [True, False],
+        "no_thp": [True, False],
     }
     default_options = {
         "shared": False,
@@ -36,8 +39,26 @@ class MimallocConan(ConanFile):
         "override": False,
         "inject": False,
         "single_object": False,
+        "padding": False,
+        "opt_arch": False,
+        "no_thp": False,
     }
 
+    @property
+    def _opt_arch_flags(self):
+        # Same baselines as the MI_OPT_ARCH option of newer mimalloc releases
+        if is_msvc(self):
+            return {"x86_64": ["/arch:AVX2"]}.get(str(self.settings.arch), [])
+        return {
+            "x86_64": ["-march=haswell", "-mavx2"],
+            "armv8": ["-march=armv8.1-a"],
+        }.get(str(self.settings.arch), [])
+
+    @property
+    def _has_no_thp(self):
+        version = Version(self.version)
+        return version >= "2.1.7" or "1.8.7" <= version < "2.0.0"
+
     def export_sources(self):
         export_conandata_patches(self)
 
@@ -51,6 +72,12 @@ class MimallocConan(ConanFile):
             del self.options.single_object
             del self.options.inject
 
+        if not self._opt_arch_flags:
+            del self.options.opt_arch
+        # Transparent huge pages only exist on Linux
+        if not self._has_no_thp or self.settings.os not in ("Linux", "Android"):
+            del self.options.no_thp
+
     def configure(self):
         if self.options.shared:
             self.options.rm_safe("fPIC")
@@ -109,6 +136,13 @@ class MimallocConan(ConanFile):
         tc.variables["MI_BUILD_OBJECT"] = self.options.get_safe("single_object", False)
         tc.variables["MI_OVERRIDE"] = "ON" if self.options.override else "OFF"
         tc.variables["MI_SECURE"] = "ON" if self.options.secure else "OFF"
+        if self.options.padding:
+            tc.variables["MI_PADDING"] = "ON"
+        if self.options.get_safe("no_thp"):
+            tc.variables["MI_NO_THP"] = "ON"
+        if self.options.get_safe("opt_arch"):
+            tc.extra_cflags.extend(self._opt_arch_flags)
+            tc.extra_cxxflags.extend(self._opt_arch_flags)
         tc.variables["MI_WIN_REDIRECT"] = "OFF"
         if Version(self.version) >= "1.7.0":
             tc.variables["MI_INSTALL_TOPLEVEL"] = "ON"
@@ -0,0 +1,53 @@
+#include "mimalloc.h"
+
+#include <stdint.h>
+#include <stdio.h>
+#include <stdlib.h>
+#include <time.h>
+
+// Reproducible malloc/free throughput benchmark: the same pseudo-random sequence
+// of sizes is replayed for every run, so results can be compared across option sets.
+
+#define LIVE_ALLOCATIONS 4096
+
+static double now_seconds(void) {
+    struct timespec ts;
+    timespec_get(&ts, TIME_UTC);
+    return ts.tv_sec + ts.tv_nsec / 1e9;
+}
+
+static double run(size_t min_size, size_t max_size, size_t iterations) {
+    static void *live[LIVE_ALLOCATIONS];
+    uint32_t state = 12345u;
+    double start = now_seconds();
+    for (size_t i = 0; i < iterations; i++) {
+        state = state * 1664525u + 1013904223u;
+        size_t size = min_size + (state >> 8) % (max_size - min_size + 1);
+        // Free a pseudo-randomly chosen live block, not the oldest one, to fragment the heap
+        size_t slot = (state >> 4) % LIVE_ALLOCATIONS;
+        mi_free(live[slot]);
+        live[slot] = mi_malloc(size);
+        if (live[slot] == NULL) {
+            abort();
+        }
+        ((char *)live[slot])[size - 1] = (char)i;
+    }
+    for (size_t i = 0; i < LIVE_ALLOCATIONS; i++) {
+        mi_free(live[i]);
+        live[i] = NULL;
+    }
+    return now_seconds() - start;
+}
+
+int main(int argc, char **argv) {
+    size_t iterations = argc > 1 ? strtoul(argv[1], NULL, 10) : 1000000;
+    const size_t sizes[][2] = {{8, 64}, {64, 512}, {512, 4096}, {4096, 65536}};
+
+    printf("mimalloc version %d, %zu malloc/free pairs per size range\n", mi_version(), iterations);
+    for (size_t i = 0; i < sizeof(sizes) / sizeof(sizes[0]); i++) {
+        double elapsed = run(sizes[i][0], sizes[i][1], iterations);
+        printf("  %6zu - %6zu bytes: %.3f s, %.1f Mops/s\n",
+               sizes[i][0], sizes[i][1], elapsed, 2.0 * iterations / elapsed / 1e6);
+    }
+    return 0;
+}
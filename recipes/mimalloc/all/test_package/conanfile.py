@@ -32,6 +32,11 @@ class TestPackageConan(ConanFile):
         # Non injected override
         return ["include_override", "mi_api"]
 
+    @property
+    def _build_benchmark(self):
+        # The mi_* API is not available when mimalloc is injected
+        return not self.dependencies["mimalloc"].options.get_safe("inject")
+
     @property
     def _lib_name(self):
         name = "mimalloc" if self.settings.os == "Windows" else "libmimalloc"
@@ -48,6 +53,7 @@ class TestPackageConan(ConanFile):
         tc.variables["BUILD_NO_CHANGES"] = "no_changes" in self._test_files()
         tc.variables["BUILD_INCLUDE_OVERRIDE"] = "include_override" in self._test_files()
         tc.variables["BUILD_MI_API"] = "mi_api" in self._test_files()
+        tc.variables["BUILD_BENCHMARK"] = self._build_benchmark
         tc.generate()
 
         env = Environment()
@@ -70,3 +76,5 @@ class TestPackageConan(ConanFile):
         if can_run(self):
             with chdir(self, self.build_folder):
                 self.run(f"ctest --output-on-failure -C {self.settings.build_type} -j {build_jobs(self)}", env="conanrun")
+            if self._build_benchmark:
+                self.run(os.path.join(self.cpp.build.bindirs[0], "benchmark"), env="conanrun")
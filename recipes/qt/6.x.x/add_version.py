@@ -1,5 +1,8 @@
 #!/usr/bin/env python3
-import sys
+import argparse
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from hashlib import sha256
 from pathlib import Path
 
@@ -11,6 +14,7 @@ script_dir = Path(__file__).parent
 
 # qt.io does not provide Content-Length info, so using a mirror instead.
 base_url = "https://qt-mirror.dannhauer.de/archive/"
+github_url = "https://github.com/"
 
 # Modules that are not available as a downloadable archive and which must be fetched from GitHub instead.
 git_components = [
@@ -20,10 +24,20 @@ git_components = [
     "qtopcua",
 ]
 
-def get_components_list(version):
+_sessions = threading.local()
+
+
+def get_session():
+    # requests.Session is not guaranteed to be thread-safe, so keep one per worker thread
+    if not hasattr(_sessions, "session"):
+        _sessions.session = requests.Session()
+    return _sessions.session
+
+
+def get_components_list(version, base_url=base_url):
     version = Version(version)
     url = f"{base_url}qt/{version.major}.{version.minor}/{version}/submodules/md5sums.txt"
-    r = requests.get(url)
+    r = get_session().get(url)
     r.raise_for_status()
     components = []
     for l in r.text.splitlines():
@@ -33,51 +47,83 @@ def get_components_list(version):
     return sorted(components + git_components)
 
 
-def get_url(version, component):
+def get_url(version, component, base_url=base_url, github_url=github_url):
     version = Version(version)
     if component in git_components:
-        return f"https://github.com/qt/{component}/archive/refs/tags/v{version}.tar.gz"
+        return f"{github_url}qt/{component}/archive/refs/tags/v{version}.tar.gz"
     return f"{base_url}qt/{version.major}.{version.minor}/{version}/submodules/{component}-everywhere-src-{version}.tar.xz"
 
 
-def get_download_size(session, url):
-    with session.head(url) as r:
+def get_download_size(url):
+    with get_session().head(url, allow_redirects=True) as r:
         r.raise_for_status()
         return int(r.headers["Content-Length"])
 
 
-def add_source_hashes(version):
+def hash_archive(url, progress):
+    """Stream the archive at url through sha256 without keeping it in memory."""
+    sha256sum = sha256()
+    with get_session().get(url, stream=True) as r:
+        r.raise_for_status()
+        for chunk in r.iter_content(chunk_size=100_000):
+            progress.update(len(chunk))
+            sha256sum.update(chunk)
+    return sha256sum.hexdigest().lower()
+
+
+def format_hash_line(component, hash, file_size):
+    return f'  {component + ":": <19} "{hash}"  # {file_size / 1_000_000: 6.1f} MB\n'
+
+
+def read_partial_hashes(yml_path):
+    """Read the hash lines already written by an interrupted run, keyed by component."""
+    if not yml_path.is_file():
+        return {}
+    lines = {}
+    for line in yml_path.read_text().splitlines(keepends=True):
+        m = re.match(r'  (\w+):\s+"([0-9a-f]{64})"', line)
+        if m:
+            lines[m.group(1)] = line
+    return lines
+
+
+def add_source_hashes(version, base_url=base_url, github_url=github_url, jobs=8):
     print("Computing source archive hashes...")
-    components = get_components_list(version)
+    components = get_components_list(version, base_url)
     yml_path = script_dir / "sources" / f"{version}.yml"
-    with requests.Session() as session:
+    done = read_partial_hashes(yml_path)
+    if done:
+        print(f"Resuming, {len(done)} hashes already present in {yml_path.name}")
+    todo = [component for component in components if component not in done]
+
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
         # Fetch sizes before downloading to check that all URLs are valid.
-        urls = {component: get_url(version, component) for component in components}
-        archive_sizes = {
-            component: get_download_size(session, url) for component, url in tqdm(urls.items(), desc="Fetching sizes")
-        }
+        urls = {component: get_url(version, component, base_url, github_url) for component in todo}
+        archive_sizes = dict(zip(todo, tqdm(executor.map(get_download_size, urls.values()), total=len(urls), desc="Fetching sizes")))
+
         with yml_path.open("w") as f:
+            # Rewrite the hashes of the previous run first, so the file stays resumable at all times
             f.write("hashes:\n")
-            overall_progress = tqdm(total=sum(archive_sizes.values()), desc="Overall progress", unit="B", unit_scale=True, position=0)
-            for component in components:
-                url = urls[component]
-                file_size = archive_sizes[component]
-                progress = tqdm(total=file_size, unit="B", unit_scale=True, desc=component, leave=False, position=1)
-                sha256sum = sha256()
-                with requests.get(url, stream=True) as r:
-                    r.raise_for_status()
-                    for chunk in r.iter_content(chunk_size=100_000):
-                        overall_progress.update(len(chunk))
-                        progress.update(len(chunk))
-                        sha256sum.update(chunk)
-                progress.close()
-                hash = sha256sum.hexdigest().lower()
-                f.write(f'  {component + ":": <19} "{hash}"  # {file_size / 1_000_000: 6.1f} MB\n')
+            f.writelines(done.values())
+            f.flush()
+            overall_progress = tqdm(total=sum(archive_sizes.values()), desc="Overall progress", unit="B", unit_scale=True)
+            futures = {executor.submit(hash_archive, urls[component], overall_progress): component for component in todo}
+            for future in as_completed(futures):
+                component = futures[future]
+                done[component] = format_hash_line(component, future.result(), archive_sizes[component])
+                f.write(done[component])
                 f.flush()
+                tqdm.write(f"{component}: done")
             overall_progress.close()
-            f.write("git_only:\n")
-            for component in git_components:
-                f.write(f'  - {component}\n')
+
+    # All archives are hashed, write the final file in a stable order
+    with yml_path.open("w") as f:
+        f.write("hashes:\n")
+        for component in components:
+            f.write(done[component])
+        f.write("git_only:\n")
+        for component in git_components:
+            f.write(f'  - {component}\n')
 
 def fetch_gitmodules(version):
     conf_path = script_dir.joinpath("qtmodules", f"{version}.conf")
@@ -88,6 +134,13 @@ def fetch_gitmodules(version):
     conf_path.write_text(r.text)
 
 if __name__ == "__main__":
-    version = sys.argv[1]
-    fetch_gitmodules(version)
-    add_source_hashes(version)
+    parser = argparse.ArgumentParser(description="Add sources/<version>.yml and qtmodules/<version>.conf for a new Qt version.")
+    parser.add_argument("version")
+    parser.add_argument("--mirror", default=base_url, help="Qt archive mirror to download from (default: %(default)s)")
+    parser.add_argument("--github-url", default=github_url, help="GitHub base URL for git-only modules (default: %(default)s)")
+    parser.add_argument("-j", "--jobs", type=int, default=8, help="number of concurrent downloads (default: %(default)s)")
+    parser.add_argument("--skip-gitmodules", action="store_true", help="do not fetch qtmodules/<version>.conf")
+    args = parser.parse_args()
+    if not args.skip_gitmodules:
+        fetch_gitmodules(args.version)
+    add_source_hashes(args.version, args.mirror, args.github_url, args.jobs)
@@ -1,7 +1,10 @@
 import os
 import platform
 import textwrap
+import time
+import urllib.request
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
 from pathlib import Path
 
@@ -12,7 +15,7 @@ from conan.tools.apple import is_apple_os
 from conan.tools.build import cross_building, check_min_cppstd, default_cppstd, can_run
 from conan.tools.cmake import CMake, CMakeDeps, CMakeToolchain, cmake_layout
 from conan.tools.env import VirtualBuildEnv, VirtualRunEnv, Environment
-from conan.tools.files import copy, get, replace_in_file, apply_conandata_patches, save, rm, rmdir, export_conandata_patches
+from conan.tools.files import copy, download, unzip, replace_in_file, apply_conandata_patches, save, rm, rmdir, export_conandata_patches
 from conan.tools.gnu import PkgConfigDeps
 from conan.tools.microsoft import msvc_runtime_flag, is_msvc, is_msvc_static_runtime
 from conan.tools.scm import Version
@@ -706,7 +709,9 @@ class QtConan(ConanFile):
         Generate the equivalent of self.conan_data["sources"][self.version] for each enabled module,
         based on sources/<version>.yml and mirrors.txt.
         """
+        version = Version(self.version)
         mirrors = Path(self.recipe_folder, "mirrors.txt").read_text().strip().split()
+        mirrors = self._sort_mirrors(mirrors, f"qt/{version.major}.{version.minor}/{version}/submodules/qtbase-everywhere-src-{version}.tar.xz")
         archive_info = yaml.safe_load(Path(self.recipe_folder, "sources", f"{self.version}.yml").read_text())
         hashes = archive_info["hashes"]
         # Modules that are not available as source archives and must be downloaded from git instead.
@@ -715,7 +720,6 @@ class QtConan(ConanFile):
         merged_modules = {"qtquickcontrols2": "qtdeclarative"}
 
         def _get_module_urls(component):
-            version = Version(self.version)
             if component in git_only:
                 return [f"https://github.com/qt/{component}/archive/refs/tags/v{version}.tar.gz"]
             return [f"{base_url}qt/{version.major}.{version.minor}/{version}/submodules/{component}-everywhere-src-{version}.tar.xz" for base_url in mirrors]
@@ -735,21 +739,53 @@ class QtConan(ConanFile):
             download_info[module] = _get_info(module)
         return download_info
 
+    def _sort_mirrors(self, mirrors, probe_path):
+        """
+        Order the mirrors by the latency of a HEAD request for probe_path, probing all of them concurrently.
+        Mirrors that fail to respond are moved to the end, keeping their original relative order.
+        """
+        def _probe(base_url):
+            start = time.perf_counter()
+            try:
+                request = urllib.request.Request(base_url + probe_path, method="HEAD")
+                with urllib.request.urlopen(request, timeout=5):
+                    pass
+            except Exception:
+                return float("inf")
+            return time.perf_counter() - start
+
+        with ThreadPoolExecutor(max_workers=len(mirrors)) as executor:
+            latencies = list(executor.map(_probe, mirrors))
+        return [mirror for _, mirror in sorted(zip(latencies, mirrors), key=lambda x: x[0])]
+
     def _get_sources(self):
         """
         Equivalent to source(), but downloads only the relevant source archives based on the configuration.
+        Archives are downloaded concurrently and each one is extracted as soon as it and all archives before it
+        are available, so extraction overlaps with the remaining downloads.
         """
         destination = self.source_folder
         if platform.system() == "Windows":
             # Don't use os.path.join, or it removes the \\?\ prefix, which enables long paths
             destination = rf"\\?\{self.source_folder}"
         download_info = self._get_download_info()
-        get(self, **download_info["root"], strip_root=True, destination=destination)
-        for component, info in download_info.items():
-            if component == "root":
-                continue
-            self.output.info(f"Fetching {component}...")
-            get(self, **info, strip_root=True, destination=os.path.join(destination, component))
+        downloads_folder = os.path.join(self.build_folder, "qt_downloads")
+        os.makedirs(downloads_folder, exist_ok=True)
+
+        def _download(component, info):
+            # Git-only archives are all named v<version>.tar.gz, prefix them to keep them apart
+            filename = os.path.join(downloads_folder, f"{component}-{os.path.basename(info['url'][0])}")
+            download(self, **info, filename=filename)
+            return filename
+
+        with ThreadPoolExecutor(max_workers=min(8, len(download_info))) as executor:
+            futures = {component: executor.submit(_download, component, info) for component, info in download_info.items()}
+            for component, future in futures.items():
+                filename = future.result()
+                self.output.info(f"Extracting {component}...")
+                unzip(self, filename, strip_root=True,
+                      destination=destination if component == "root" else os.path.join(destination, component))
+                os.unlink(filename)
         # Remove empty subdirs
         for path in Path(self.source_folder).iterdir():
             if path.is_dir() and not list(path.iterdir()):
@@ -19,6 +19,13 @@ from conan.tools.scm import Version
 required_conan_version = ">=1.56 <2 || >=2.0.6"
 
 
+@functools.lru_cache()
+def _load_module_index(path):
+    # Loaded once per process, shared by all instances of the recipe (one per version and configuration)
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
 class VtkConan(ConanFile):
     name = "vtk"
     description = ("The Visualization Toolkit (VTK) by Kitware is an open-source,"
@@ -203,15 +210,24 @@ class VtkConan(ConanFile):
         }
 
     def export(self):
-        copy(self, "*.json", self.recipe_folder, self.export_folder)
+        # options/index.json is generated from options/<version>.json by update_options.py --update-index
+        copy(self, "index.json", os.path.join(self.recipe_folder, "options"), os.path.join(self.export_folder, "options"))
+
+    @property
+    def _module_index(self):
+        return _load_module_index(os.path.join(self.recipe_folder, "options", "index.json"))
+
+    @property
+    def _module_index_version(self):
+        version = str(self.version)
+        if version not in self._module_index["versions"]:
+            raise ConanException(f"{self.ref}: no module info for {version} in options/index.json. "
+                                 "Add options/<version>.json and run update_options.py --update-index.")
+        return self._module_index["versions"][version]
 
     @property
     def _modules_from_all_versions(self):
-        all_modules = set()
-        for options_json in Path(self.recipe_folder, "options").glob("*.json"):
-            modules = [m for m in json.loads(options_json.read_text())["flat_external_deps"] if m[0].isupper()]
-            all_modules.update(modules)
-        return sorted(all_modules)
+        return self._module_index["modules"]
 
     def init(self):
         # Skip module options support for Conan v1 because
@@ -223,14 +239,12 @@ class VtkConan(ConanFile):
             self.options.update(new_options, new_defaults)
 
     @property
-    @functools.lru_cache()
     def _module_ext_deps(self):
-        return json.loads(Path(self.recipe_folder, "options", f"{self.version}.json").read_text())["flat_external_deps"]
+        return self._module_index_version["flat_external_deps"]
 
     @property
-    @functools.lru_cache()
     def _module_opt_deps(self):
-        return json.loads(Path(self.recipe_folder, "options", f"{self.version}.json").read_text())["optional_external_deps"]
+        return self._module_index_version["optional_external_deps"]
 
     @property
     @functools.lru_cache()
@@ -1,10 +1,18 @@
 #! /usr/bin/python
 # Usage: ./update_options.py <vtk-source-path> > options/<version>.json
 # Run with --dump-metadata to get the raw metadata extracted from module.vtk files instead.
+# Then run ./update_options.py --update-index to regenerate options/index.json, which is what the recipe loads.
+#
+# To add or refresh several versions at once:
+#   ./update_options.py --write <vtk-9.3.1-source-path> <vtk-9.4.0-source-path> ...
+# This writes options/<version>.json for each source tree, updates the index and prints
+# what changed compared to the previous version.
 
 import argparse
 import json
+import re
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 
@@ -84,25 +92,22 @@ def find_vtk_modules(root, name="vtk.module", exclude=("Examples", "Testing")):
             yield path
 
 
+def _collect_details(root, paths, parsed):
+    details = {}
+    for path, info in zip(paths, parsed):
+        info["path"] = str(path.parent.relative_to(root))
+        name = info["name"]
+        del info["name"]
+        details[name] = info
+    return details
+
 def load_vtk_module_details(root):
-    modules = {}
-    for path in find_vtk_modules(root, "vtk.module"):
-        module_info = parse_vtk_module(path)
-        module_info["path"] = str(path.parent.relative_to(root))
-        name = module_info["name"]
-        del module_info["name"]
-        modules[name] = module_info
-    return modules
+    paths = list(find_vtk_modules(root, "vtk.module"))
+    return _collect_details(root, paths, map(parse_vtk_module, paths))
 
 def load_vtk_kit_details(root):
-    kits = {}
-    for path in find_vtk_modules(root, "vtk.kit"):
-        kit_info = parse_vtk_module(path)
-        kit_info["path"] = str(path.parent.relative_to(root))
-        name = kit_info["name"]
-        del kit_info["name"]
-        kits[name] = kit_info
-    return kits
+    paths = list(find_vtk_modules(root, "vtk.kit"))
+    return _collect_details(root, paths, map(parse_vtk_module, paths))
 
 def load_vtk_info(root):
     return {
@@ -110,6 +115,31 @@ def load_vtk_info(root):
         "kits": load_vtk_kit_details(root),
     }
 
+def load_vtk_infos(roots, jobs=None):
+    """load_vtk_info() for several source trees, parsing all their module files in a process pool."""
+    tasks = []
+    for root in roots:
+        for kind, name in (("modules", "vtk.module"), ("kits", "vtk.kit")):
+            tasks.append((root, kind, list(find_vtk_modules(root, name))))
+    all_paths = [path for _, _, paths in tasks for path in paths]
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        parsed = iter(executor.map(parse_vtk_module, all_paths, chunksize=32))
+        infos = {root: {} for root in roots}
+        for root, kind, paths in tasks:
+            infos[root][kind] = _collect_details(Path(root), paths, [next(parsed) for _ in paths])
+    return [infos[root] for root in roots]
+
+def detect_vtk_version(root):
+    """Read the version from CMake/vtkVersion.cmake in a VTK source tree."""
+    content = Path(root, "CMake", "vtkVersion.cmake").read_text(encoding="utf8")
+    parts = []
+    for part in ("MAJOR", "MINOR", "BUILD"):
+        m = re.search(rf"set\(VTK_{part}_VERSION\s+(\w+)\)", content)
+        if not m:
+            raise RuntimeError(f"VTK_{part}_VERSION not found in {root}/CMake/vtkVersion.cmake")
+        parts.append(m.group(1))
+    return ".".join(parts)
+
 
 #### DUMP OPTIONS ####
 
@@ -226,22 +256,17 @@ def _is_ext_dep(name):
     return name[0].islower() and name != "sys"
 
 def _flattened_deps(dependencies_map):
-    def _traverse(module_name, all_deps):
-        if module_name in flat_deps:
-            return flat_deps[module_name]
-        deps = all_deps.get(module_name, set())
-        for dep in list(deps):
-            deps.union(_traverse(dep, all_deps))
-        deps = set(dep for dep in deps if _is_ext_dep(dep))
-        flat_deps[module_name] = deps
-        return deps
-
-    flat_deps = {}
-    for mod in dependencies_map:
-        _traverse(mod, dependencies_map)
-    return flat_deps
+    """Direct external dependencies of each module.
 
-def dump_options(vtk_info):
+    Despite the name, the dependencies of the modules a module depends on are not included: the
+    checked-in options/<version>.json files and the recipe rely on the direct dependencies only.
+    """
+    return {
+        module_name: set(dep for dep in deps if _is_ext_dep(dep))
+        for module_name, deps in dependencies_map.items()
+    }
+
+def compute_options(vtk_info):
     modules_deps = {}
     for module_name, module_info in vtk_info["modules"].items():
         module_name = _strip_prefix(module_name)
@@ -273,20 +298,134 @@ def dump_options(vtk_info):
             if deps:
                 opt_deps[module_name] = deps
 
-    print(json.dumps({
+    return {
         "flat_external_deps": flat_deps,
         "optional_external_deps": opt_deps,
         "conditions": conditions,
-    }, indent=2))
+    }
+
+def dump_options(vtk_info):
+    print(json.dumps(compute_options(vtk_info), indent=2))
+
+
+#### REVIEW CHANGES ####
+
+def diff_options(old, new):
+    """Describe the changes between two options/<version>.json contents, one line per module."""
+    lines = []
+    for section in ("flat_external_deps", "optional_external_deps", "conditions"):
+        old_section, new_section = old.get(section, {}), new.get(section, {})
+        changes = []
+        for key in sorted(set(old_section) | set(new_section)):
+            if key not in old_section:
+                changes.append(f"  + {key}: {', '.join(new_section[key])}")
+            elif key not in new_section:
+                changes.append(f"  - {key}")
+            elif old_section[key] != new_section[key]:
+                added = sorted(set(new_section[key]) - set(old_section[key]))
+                removed = sorted(set(old_section[key]) - set(new_section[key]))
+                changes.append(f"  ~ {key}: " + " ".join([f"+{d}" for d in added] + [f"-{d}" for d in removed]))
+        if changes:
+            lines.append(f"{section}:")
+            lines.extend(changes)
+    return lines
+
+def write_options(roots, options_dir, jobs=None):
+    """Extract and write options/<version>.json for each VTK source tree, then update the index."""
+    options_dir = Path(options_dir)
+    versions = [detect_vtk_version(root) for root in roots]
+    written = {}
+    for version, vtk_info in zip(versions, load_vtk_infos(roots, jobs)):
+        path = options_dir / f"{version}.json"
+        previous = json.loads(path.read_text()) if path.is_file() else None
+        options = compute_options(vtk_info)
+        path.write_text(json.dumps(options, indent=2) + "\n")
+        written[version] = (previous, options)
+    write_index(options_dir)
+
+    # Compare each version with the one it replaces, or with the closest older version
+    all_versions = [p.stem for p in _options_files(options_dir)]
+    for version in sorted(written, key=_version_key):
+        previous, options = written[version]
+        if previous is not None:
+            reference = f"previous {version}.json"
+        else:
+            older = [v for v in all_versions if _version_key(v) < _version_key(version)]
+            if not older:
+                print(f"{version}: new, no older version to compare with")
+                continue
+            reference = f"{older[-1]}.json"
+            previous = json.loads((options_dir / reference).read_text())
+        changes = diff_options(previous, options)
+        print(f"{version}: {'no changes' if not changes else f'{len(changes)} lines changed'} compared to {reference}")
+        for line in changes:
+            print(line)
+
+#### MODULE INDEX ####
+
+INDEX_NAME = "index.json"
+
+def _version_key(version):
+    return [int(x) if x.isdigit() else x for x in version.split(".")]
+
+def _options_files(options_dir):
+    """options/<version>.json files, sorted by version."""
+    paths = [p for p in Path(options_dir).glob("*.json") if p.name != INDEX_NAME]
+    return sorted(paths, key=lambda p: _version_key(p.stem))
+
+def build_index(options_dir):
+    """Merge all options/<version>.json files into the single index loaded by the recipe.
+
+    The index holds the union of the modules of all versions (the recipe options) and the
+    per-version dependency maps, so the recipe reads one file whatever the number of versions.
+    """
+    all_modules = set()
+    versions = {}
+    for path in _options_files(options_dir):
+        options = json.loads(path.read_text())
+        all_modules.update(m for m in options["flat_external_deps"] if m[0].isupper())
+        versions[path.stem] = {
+            "flat_external_deps": options["flat_external_deps"],
+            "optional_external_deps": options["optional_external_deps"],
+        }
+    return {
+        "modules": sorted(all_modules),
+        "versions": versions,
+    }
+
+def write_index(options_dir):
+    index = build_index(options_dir)
+    # Compact, one version per line to keep the diffs readable
+    lines = [f'"modules":{json.dumps(index["modules"], separators=(",", ":"))}']
+    lines += [f'{json.dumps(version)}:{json.dumps(info, separators=(",", ":"))}' for version, info in index["versions"].items()]
+    content = "{" + lines[0] + ',\n"versions":{\n' + ",\n".join(lines[1:]) + "\n}}\n"
+    Path(options_dir, INDEX_NAME).write_text(content)
 
 def main(argv=None):
     parser = argparse.ArgumentParser(
         description="Conan VTK Recipe Helper for adding new VTK versions to recipe - tool for extracting module information from VTK source",
     )
-    parser.add_argument("source_path")
+    parser.add_argument("source_paths", nargs="*", metavar="source_path")
     parser.add_argument("--dump-metadata", action="store_true")
+    parser.add_argument("--update-index", action="store_true",
+                        help=f"regenerate options/{INDEX_NAME} from all options/<version>.json files and exit")
+    parser.add_argument("--write", action="store_true",
+                        help="write options/<version>.json for each source path, update the index and print the changes")
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                        help="number of processes parsing module files with --write (default: one per CPU)")
     args = parser.parse_args(argv)
-    vtk_info = load_vtk_info(args.source_path)
+    options_dir = Path(__file__).parent / "options"
+    if args.update_index:
+        write_index(options_dir)
+        return
+    if args.write:
+        if not args.source_paths:
+            parser.error("--write requires at least one source_path")
+        write_options(args.source_paths, options_dir, args.jobs)
+        return
+    if len(args.source_paths) != 1:
+        parser.error("exactly one source_path is required, use --write for several")
+    vtk_info = load_vtk_info(args.source_paths[0])
     if args.dump_metadata:
         print(json.dumps(vtk_info, indent=2))
     else:
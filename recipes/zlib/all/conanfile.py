@@ -1,6 +1,9 @@
 from conan import ConanFile
+from conan.errors import ConanInvalidConfiguration
+from conan.tools.apple import fix_apple_shared_install_name
 from conan.tools.cmake import CMake, CMakeToolchain, cmake_layout
-from conan.tools.files import apply_conandata_patches, export_conandata_patches, get, load, replace_in_file, save
+from conan.tools.files import apply_conandata_patches, copy, export_conandata_patches, get, load, replace_in_file, rmdir, save
+from conan.tools.microsoft import is_msvc
 from conan.tools.scm import Version
 import os
 
@@ -21,16 +24,32 @@ class ZlibConan(ConanFile):
     options = {
         "shared": [True, False],
         "fPIC": [True, False],
+        # zlib-ng: build zlib-ng in zlib compatible mode instead, with the same
+        # headers, library name and targets but SIMD optimized deflate/inflate
+        "backend": ["zlib", "zlib-ng"],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
+        "backend": "zlib",
     }
 
     @property
     def _is_mingw(self):
         return self.settings.os == "Windows" and self.settings.compiler == "gcc"
 
+    @property
+    def _zlib_ng(self):
+        return self.options.backend == "zlib-ng"
+
+    @property
+    def _zlib_source_folder(self):
+        return os.path.join(self.source_folder, "zlib")
+
+    @property
+    def _zlib_ng_source_folder(self):
+        return os.path.join(self.source_folder, "zlib-ng")
+
     def export_sources(self):
         export_conandata_patches(self)
 
@@ -47,9 +66,18 @@ class ZlibConan(ConanFile):
     def layout(self):
         cmake_layout(self, src_folder="src")
 
+    def validate(self):
+        if self._zlib_ng and self.version not in self.conan_data.get("zlib-ng", {}):
+            raise ConanInvalidConfiguration(f"backend=zlib-ng is not available for {self.ref}, "
+                                            f"only for versions {', '.join(self.conan_data['zlib-ng'])}")
+
     def source(self):
         get(self, **self.conan_data["sources"][self.version],
-            destination=self.source_folder, strip_root=True)
+            destination=self._zlib_source_folder, strip_root=True)
+        # source() cannot depend on options: fetch zlib-ng whenever this version has a backend=zlib-ng source
+        zlib_ng = self.conan_data.get("zlib-ng", {}).get(self.version)
+        if zlib_ng:
+            get(self, **zlib_ng, destination=self._zlib_ng_source_folder, strip_root=True)
 
     def generate(self):
         tc = CMakeToolchain(self)
@@ -61,6 +89,12 @@ class ZlibConan(ConanFile):
         tc.variables["INSTALL_LIB_DIR"] = "lib"
         tc.variables["INSTALL_INC_DIR"] = "include"
         tc.variables["ZLIB_BUILD_EXAMPLES"] = False
+        if self._zlib_ng:
+            tc.variables["ZLIB_COMPAT"] = True
+            tc.variables["ZLIB_ENABLE_TESTS"] = False
+            tc.variables["ZLIBNG_ENABLE_TESTS"] = False
+            tc.variables["WITH_GTEST"] = False
+            tc.variables["WITH_GZFILEOP"] = True
         tc.generate()
 
     def _patch_sources(self):
@@ -69,7 +103,7 @@ class ZlibConan(ConanFile):
         is_apple_clang12 = self.settings.compiler == "apple-clang" and Version(self.settings.compiler.version) >= "12.0"
         if not is_apple_clang12:
             for filename in ['zconf.h', 'zconf.h.cmakein', 'zconf.h.in']:
-                filepath = os.path.join(self.source_folder, filename)
+                filepath = os.path.join(self._zlib_source_folder, filename)
                 replace_in_file(self, filepath,
                                       '#ifdef HAVE_UNISTD_H    '
                                       '/* may be set to #if 1 by ./configure */',
@@ -80,27 +114,44 @@ class ZlibConan(ConanFile):
                                       '#if defined(HAVE_STDARG_H) && (1-HAVE_STDARG_H-1 != 0)')
 
     def build(self):
-        self._patch_sources()
         cmake = CMake(self)
-        cmake.configure()
+        if self._zlib_ng:
+            cmake.configure(build_script_folder="zlib-ng")
+        else:
+            self._patch_sources()
+            cmake.configure(build_script_folder="zlib")
         cmake.build()
 
     def _extract_license(self):
-        tmp = load(self, os.path.join(self.source_folder, "zlib.h"))
+        tmp = load(self, os.path.join(self._zlib_source_folder, "zlib.h"))
         license_contents = tmp[2:tmp.find("*/", 1)]
         return license_contents
 
     def package(self):
-        save(self, os.path.join(self.package_folder, "licenses", "LICENSE"), self._extract_license())
+        if self._zlib_ng:
+            copy(self, "LICENSE.md", src=self._zlib_ng_source_folder, dst=os.path.join(self.package_folder, "licenses"))
+        else:
+            save(self, os.path.join(self.package_folder, "licenses", "LICENSE"), self._extract_license())
         cmake = CMake(self)
         cmake.install()
+        if self._zlib_ng:
+            rmdir(self, os.path.join(self.package_folder, "lib", "pkgconfig"))
+            rmdir(self, os.path.join(self.package_folder, "lib", "cmake"))
+            # zlib-ng hardcodes the install_name with the full install path
+            fix_apple_shared_install_name(self)
 
     def package_info(self):
         self.cpp_info.set_property("cmake_find_mode", "both")
         self.cpp_info.set_property("cmake_file_name", "ZLIB")
         self.cpp_info.set_property("cmake_target_name", "ZLIB::ZLIB")
         self.cpp_info.set_property("pkg_config_name", "zlib")
-        if self.settings.os == "Windows" and not self._is_mingw:
+        if self._zlib_ng and self.settings.os == "Windows":
+            # Same naming as the zlib-ng recipe with zlib_compat=True
+            base = "zlib" if is_msvc(self) or self.options.shared else "z"
+            static_flag = "static" if is_msvc(self) and not self.options.shared else ""
+            build_type = "d" if self.settings.build_type == "Debug" else ""
+            libname = f"{base}{static_flag}{build_type}"
+        elif self.settings.os == "Windows" and not self._is_mingw:
             libname = "zdll" if self.options.shared else "zlib"
         else:
             libname = "z"
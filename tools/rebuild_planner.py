@@ -0,0 +1,235 @@
+"""Plan the rebuild of everything downstream of changed recipes, in dependency order.
+
+The requirements of every recipe are taken from the static catalog of recipe_catalog.py,
+so no recipe is executed. The recipes to rebuild are grouped in waves: all recipes of a
+wave only depend on recipes of earlier waves and can be built concurrently.
+"""
+import argparse
+import json
+import math
+import re
+import sys
+from collections import defaultdict
+
+try:
+    from .recipe_catalog import read_catalog, update_catalog, write_catalog
+except ImportError:
+    # Run as a script, e.g. python tools/rebuild_planner.py
+    from recipe_catalog import read_catalog, update_catalog, write_catalog
+
+# Kinds of requirements that make a package need a rebuild when the requirement changes
+HOST_KINDS = ("requires",)
+BUILD_KINDS = ("tool_requires", "build_requires")
+
+_ref_name = re.compile(r"^(?:f?['\"])?([A-Za-z0-9_][A-Za-z0-9_.+-]*)/")
+
+
+def requirement_name(ref):
+    """The package name of a reference, also for the source of f-strings like f"boost/{version}"."""
+    if not isinstance(ref, str):
+        return None
+    m = _ref_name.match(ref)
+    return m.group(1) if m else None
+
+
+def dependency_graph(catalog, kinds=HOST_KINDS):
+    """Map each recipe name to the recipe names it requires, in any of its folders."""
+    graph = defaultdict(set)
+    for key, info in catalog["recipes"].items():
+        name = key.split("/", 1)[0]
+        graph[name]
+        for requirement in info.get("requires", []):
+            dep = requirement_name(requirement["ref"])
+            if requirement["kind"] in kinds and dep and dep != name:
+                graph[name].add(dep)
+    return graph
+
+
+def reverse_graph(graph):
+    reverse = defaultdict(set)
+    for name, deps in graph.items():
+        for dep in deps:
+            reverse[dep].add(name)
+    return reverse
+
+
+def downstream(reverse, changed):
+    """The changed recipes and every recipe depending on them, directly or not."""
+    affected = set(changed)
+    pending = list(changed)
+    while pending:
+        for dependent in reverse.get(pending.pop(), ()):
+            if dependent not in affected:
+                affected.add(dependent)
+                pending.append(dependent)
+    return affected
+
+
+def strongly_connected(graph):
+    """Strongly connected components of `graph` (Tarjan's algorithm, iterative)."""
+    index = {}
+    lowlink = {}
+    stack = []
+    on_stack = set()
+    components = []
+    for root in sorted(graph):
+        if root in index:
+            continue
+        index[root] = lowlink[root] = len(index)
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(sorted(graph[root])))]
+        while work:
+            node, children = work[-1]
+            child = next(children, None)
+            if child is not None:
+                if child not in index:
+                    index[child] = lowlink[child] = len(index)
+                    stack.append(child)
+                    on_stack.add(child)
+                    work.append((child, iter(sorted(graph.get(child, ())))))
+                elif child in on_stack:
+                    lowlink[node] = min(lowlink[node], index[child])
+                continue
+            work.pop()
+            if work:
+                lowlink[work[-1][0]] = min(lowlink[work[-1][0]], lowlink[node])
+            if lowlink[node] == index[node]:
+                component = []
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    component.append(member)
+                    if member == node:
+                        break
+                components.append(sorted(component))
+    return components
+
+
+def plan_waves(graph, affected):
+    """Group `affected` in waves, each recipe one wave after its last affected dependency.
+
+    Static requirements can form cycles that never happen in a real graph, e.g. through
+    requirements guarded by mutually exclusive options. The recipes of such a cycle are
+    scheduled together in the same wave. Returns the waves, the cycles and, for each recipe,
+    the length of the longest chain of affected recipes depending on it.
+    """
+    deps = {name: graph.get(name, set()) & affected for name in affected}
+    components = strongly_connected(deps)
+    component_of = {name: i for i, component in enumerate(components) for name in component}
+    component_deps = [{component_of[dep] for name in component for dep in deps[name]} - {i}
+                      for i, component in enumerate(components)]
+    dependents = defaultdict(set)
+    for i, dep_ids in enumerate(component_deps):
+        for dep in dep_ids:
+            dependents[dep].add(i)
+
+    remaining = [len(dep_ids) for dep_ids in component_deps]
+    wave = [i for i, count in enumerate(remaining) if count == 0]
+    component_waves = []
+    while wave:
+        component_waves.append(wave)
+        next_wave = []
+        for i in wave:
+            for dependent in dependents[i]:
+                remaining[dependent] -= 1
+                if remaining[dependent] == 0:
+                    next_wave.append(dependent)
+        wave = next_wave
+
+    # Longest chain of dependents, computed from the last wave backwards
+    chain = [0] * len(components)
+    for wave in reversed(component_waves):
+        for i in wave:
+            chain[i] = 1 + max((chain[d] for d in dependents[i]), default=0)
+    chains = {name: chain[component_of[name]] for name in affected}
+
+    waves = [sorted(name for i in wave for name in components[i]) for wave in component_waves]
+    cycles = [component for component in components if len(component) > 1]
+    return waves, cycles, chains
+
+
+def schedule(waves, chains, workers):
+    """Split each wave in batches of at most `workers` recipes.
+
+    Within a wave, the recipes heading the longest chains of dependents go first, so that
+    the next waves are unblocked as early as possible.
+    """
+    batches = []
+    for level, wave in enumerate(waves):
+        wave = sorted(wave, key=lambda name: (-chains[name], name))
+        count = math.ceil(len(wave) / workers) if workers else 1
+        size = math.ceil(len(wave) / count)
+        for i in range(count):
+            batches.append({"wave": level, "recipes": wave[i * size:(i + 1) * size]})
+    return batches
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="List the recipes to rebuild after changing some recipes, as waves that can be built concurrently."
+    )
+    parser.add_argument(
+        "changed",
+        nargs="+",
+        metavar="name",
+        help="names of the changed recipes, e.g. zlib openssl.",
+    )
+    parser.add_argument(
+        "--recipes",
+        default="recipes",
+        help="path to the recipes folder (default: %(default)s).",
+    )
+    parser.add_argument(
+        "--catalog",
+        default="recipe_catalog.json",
+        help="catalog of recipe_catalog.py, updated incrementally (default: %(default)s).",
+    )
+    parser.add_argument(
+        "-w", "--workers",
+        type=int,
+        default=0,
+        help="number of concurrent builds; waves larger than this are split in batches (default: unlimited).",
+    )
+    parser.add_argument(
+        "--tool-requires",
+        action="store_true",
+        help="also rebuild the recipes using the changed recipes as tool/build requirements.",
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="write the schedule as JSON.",
+    )
+    args = parser.parse_args()
+
+    catalog = read_catalog(args.catalog)
+    if update_catalog(catalog, args.recipes):
+        write_catalog(catalog, args.catalog)
+
+    kinds = HOST_KINDS + BUILD_KINDS if args.tool_requires else HOST_KINDS
+    graph = dependency_graph(catalog, kinds)
+    unknown = [name for name in args.changed if name not in graph]
+    if unknown:
+        parser.error(f"unknown recipes: {', '.join(unknown)}")
+
+    affected = downstream(reverse_graph(graph), args.changed)
+    waves, cycles, chains = plan_waves(graph, affected)
+    batches = schedule(waves, chains, args.workers)
+
+    if args.json:
+        json.dump({"changed": args.changed, "recipes": len(affected), "batches": batches, "cycles": cycles},
+                  sys.stdout, indent=2)
+        sys.stdout.write("\n")
+    else:
+        for i, batch in enumerate(batches):
+            print(f"# batch {i + 1} (wave {batch['wave'] + 1}, {len(batch['recipes'])} recipes)")
+            for name in batch["recipes"]:
+                print(name)
+        print(f"{len(affected)} recipes in {len(waves)} waves, {len(batches)} batches", file=sys.stderr)
+    for cycle in cycles:
+        print(f"Requirement cycle, scheduled in the same wave: {', '.join(cycle)}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
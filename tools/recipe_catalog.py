@@ -0,0 +1,333 @@
+"""Catalog the options, defaults, requirements and toolchain variables of every recipe.
+
+Every `recipes/<name>/<folder>/conanfile.py` is parsed with `ast`, never executed, so the
+catalog can be rebuilt in a fraction of the time needed to load the recipes through Conan.
+Only recipes whose conanfile.py changed since the previous catalog are parsed again.
+"""
+import argparse
+import ast
+import json
+import os
+import re
+import sqlite3
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    from .recipe_index import git_blob_sha
+except ImportError:
+    # Run as a script, e.g. python tools/recipe_catalog.py
+    from recipe_index import git_blob_sha
+
+# Bump when the extracted data changes, to invalidate existing catalogs
+CATALOG_VERSION = 1
+
+REQUIRE_KINDS = ("requires", "tool_requires", "build_requires", "test_requires")
+TOOLCHAIN_ATTRIBUTES = ("variables", "cache_variables", "preprocessor_definitions", "configure_args",
+                        "make_args", "extra_cflags", "extra_cxxflags", "extra_defines", "project_options")
+
+
+def _value(node):
+    """The literal value of a node, or its source for anything computed."""
+    try:
+        value = ast.literal_eval(node)
+    except (ValueError, TypeError, SyntaxError, RecursionError):
+        return ast.unparse(node)
+    if isinstance(value, (set, frozenset, bytes, complex)):
+        return ast.unparse(node)
+    return value
+
+
+def _dict_items(node):
+    if not isinstance(node, ast.Dict):
+        return {}
+    return {_value(k): _value(v) for k, v in zip(node.keys, node.values) if k is not None}
+
+
+def _is_self_attribute(node, names):
+    return isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name) and node.value.id == "self" \
+        and node.attr in names
+
+
+class _MethodVisitor(ast.NodeVisitor):
+    """Collect requirements and toolchain variables set in the methods of a recipe."""
+
+    def __init__(self, info):
+        self.info = info
+        self.method = None
+        self.conditions = 0
+
+    def visit_FunctionDef(self, node):
+        method = self.method
+        self.method = self.method or node.name
+        self.generic_visit(node)
+        self.method = method
+
+    def _visit_conditional(self, node):
+        self.conditions += 1
+        self.generic_visit(node)
+        self.conditions -= 1
+
+    visit_If = visit_IfExp = visit_For = visit_While = visit_Try = _visit_conditional
+
+    def visit_Call(self, node):
+        if _is_self_attribute(node.func, REQUIRE_KINDS) and node.args:
+            self.info["requires"].append({
+                "kind": node.func.attr,
+                "ref": _value(node.args[0]),
+                "method": self.method,
+                "conditional": self.conditions > 0,
+            })
+        elif isinstance(node.func, ast.Attribute) and node.func.attr == "define" and len(node.args) >= 1:
+            # Meson/Autotools style: tc.define("X", value)
+            self._add_variable("define", node.args[0], node.args[1] if len(node.args) > 1 else None)
+        self.generic_visit(node)
+
+    def visit_Assign(self, node):
+        for target in node.targets:
+            # tc.variables["X"] = value, tc.cache_variables["X"] = value, ...
+            if isinstance(target, ast.Subscript) and isinstance(target.value, ast.Attribute) \
+                    and target.value.attr in TOOLCHAIN_ATTRIBUTES:
+                self._add_variable(target.value.attr, target.slice, node.value)
+        self.generic_visit(node)
+
+    def _add_variable(self, kind, name_node, value_node):
+        self.info["toolchain_variables"].append({
+            "kind": kind,
+            "name": _value(name_node),
+            "value": _value(value_node) if value_node is not None else None,
+            "conditional": self.conditions > 0,
+        })
+
+
+def parse_recipe(content, filename="conanfile.py"):
+    """Statically extract the catalog data of the ConanFile class defined in `content`."""
+    tree = ast.parse(content, filename=filename)
+    info = {
+        "class": None,
+        "package_type": None,
+        "options": {},
+        "default_options": {},
+        "requires": [],
+        "toolchain_variables": [],
+    }
+    for node in tree.body:
+        if not isinstance(node, ast.ClassDef):
+            continue
+        if not any("ConanFile" in ast.unparse(base) for base in node.bases):
+            continue
+        info["class"] = node.name
+        visitor = _MethodVisitor(info)
+        for statement in node.body:
+            if isinstance(statement, ast.Assign) and len(statement.targets) == 1 \
+                    and isinstance(statement.targets[0], ast.Name):
+                name = statement.targets[0].id
+                if name in ("options", "default_options"):
+                    info[name] = _dict_items(statement.value)
+                elif name == "package_type":
+                    info[name] = _value(statement.value)
+                elif name in REQUIRE_KINDS:
+                    # Class attribute form: requires = "zlib/1.3" or ("a/1.0", "b/2.0")
+                    refs = _value(statement.value)
+                    for ref in refs if isinstance(refs, (list, tuple)) else [refs]:
+                        info["requires"].append({"kind": name, "ref": ref, "method": None, "conditional": False})
+            else:
+                visitor.visit(statement)
+        break
+    return info
+
+
+def _parse_file(path):
+    with open(path, encoding="utf-8") as f:
+        content = f.read()
+    try:
+        return parse_recipe(content, path), None
+    except (SyntaxError, ValueError) as e:
+        return None, str(e)
+
+
+def find_conanfiles(recipes_dir):
+    """`<name>/<folder>` keys and paths of all recipe conanfile.py files."""
+    conanfiles = {}
+    with os.scandir(recipes_dir) as recipes:
+        for recipe in recipes:
+            if not recipe.is_dir():
+                continue
+            with os.scandir(recipe.path) as folders:
+                for folder in folders:
+                    path = os.path.join(folder.path, "conanfile.py")
+                    if folder.is_dir() and os.path.isfile(path):
+                        conanfiles[f"{recipe.name}/{folder.name}"] = path
+    return conanfiles
+
+
+def update_catalog(catalog, recipes_dir, jobs=None):
+    """Bring `catalog` up to date with `recipes_dir`, parsing only new or changed recipes.
+
+    Returns the number of recipes parsed or removed.
+    """
+    if catalog.get("version") != CATALOG_VERSION:
+        catalog.clear()
+        catalog.update({"version": CATALOG_VERSION, "recipes": {}})
+    recipes = catalog["recipes"]
+    conanfiles = find_conanfiles(recipes_dir)
+    removed = set(recipes) - set(conanfiles)
+    for key in removed:
+        del recipes[key]
+
+    todo = {}
+    for key, path in conanfiles.items():
+        sha = git_blob_sha(path)
+        if key not in recipes or recipes[key]["sha"] != sha:
+            todo[key] = (path, sha)
+    if not todo:
+        return len(removed)
+
+    keys = sorted(todo)
+    paths = [todo[key][0] for key in keys]
+    if len(keys) > 50 and jobs != 1:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            results = list(executor.map(_parse_file, paths, chunksize=32))
+    else:
+        results = list(map(_parse_file, paths))
+    for key, (info, error) in zip(keys, results):
+        info = info or {}
+        info.update({"sha": todo[key][1], "error": error})
+        recipes[key] = info
+    catalog["recipes"] = dict(sorted(recipes.items()))
+    return len(keys) + len(removed)
+
+
+def read_catalog(path):
+    if not path or not os.path.isfile(path):
+        return {}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def write_catalog(catalog, path):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(catalog, f, separators=(",", ":"), sort_keys=True)
+
+
+def write_sqlite(catalog, path):
+    """Export the catalog to an SQLite database, recreated from scratch."""
+    if os.path.exists(path):
+        os.remove(path)
+    with sqlite3.connect(path) as db:
+        db.executescript("""
+            CREATE TABLE recipes (recipe TEXT PRIMARY KEY, name TEXT, folder TEXT, class TEXT, package_type TEXT, error TEXT);
+            CREATE TABLE options (recipe TEXT, option TEXT, "values" TEXT, default_value TEXT);
+            CREATE TABLE requires (recipe TEXT, kind TEXT, ref TEXT, method TEXT, conditional INTEGER);
+            CREATE TABLE toolchain_variables (recipe TEXT, kind TEXT, name TEXT, value TEXT, conditional INTEGER);
+            CREATE INDEX options_option ON options (option);
+            CREATE INDEX requires_ref ON requires (ref);
+        """)
+        for key, info in catalog["recipes"].items():
+            name, folder = key.split("/", 1)
+            db.execute("INSERT INTO recipes VALUES (?, ?, ?, ?, ?, ?)",
+                       (key, name, folder, info.get("class"), json.dumps(info.get("package_type")), info["error"]))
+            default_options = info.get("default_options", {})
+            db.executemany("INSERT INTO options VALUES (?, ?, ?, ?)",
+                           [(key, option, json.dumps(values), json.dumps(default_options.get(option)))
+                            for option, values in info.get("options", {}).items()])
+            db.executemany("INSERT INTO requires VALUES (?, ?, ?, ?, ?)",
+                           [(key, r["kind"], json.dumps(r["ref"]) if not isinstance(r["ref"], str) else r["ref"],
+                             r["method"], r["conditional"]) for r in info.get("requires", [])])
+            db.executemany("INSERT INTO toolchain_variables VALUES (?, ?, ?, ?, ?)",
+                           [(key, v["kind"], json.dumps(v["name"]) if not isinstance(v["name"], str) else v["name"],
+                             json.dumps(v["value"]), v["conditional"]) for v in info.get("toolchain_variables", [])])
+
+
+def query(catalog, option=None, requires=None, variable=None):
+    """Recipes matching all the given regular expressions, with what matched."""
+    matches = {}
+    for key, info in catalog["recipes"].items():
+        found = []
+        if option:
+            hits = [o for o in info.get("options", {}) if re.search(option, str(o))]
+            if not hits:
+                continue
+            found += [f"{o}={json.dumps(info.get('default_options', {}).get(o))}" for o in hits]
+        if requires:
+            hits = [str(r["ref"]) for r in info.get("requires", []) if re.search(requires, str(r["ref"]))]
+            if not hits:
+                continue
+            found += hits
+        if variable:
+            hits = [str(v["name"]) for v in info.get("toolchain_variables", []) if re.search(variable, str(v["name"]))]
+            if not hits:
+                continue
+            found += sorted(set(hits))
+        matches[key] = found
+    return matches
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Build a catalog of the options, requirements and toolchain variables of every recipe, "
+                    "without executing them, and query it."
+    )
+    parser.add_argument(
+        "--recipes",
+        default="recipes",
+        help="path to the recipes folder (default: %(default)s).",
+    )
+    parser.add_argument(
+        "--catalog",
+        default="recipe_catalog.json",
+        help="JSON catalog to update incrementally (default: %(default)s).",
+    )
+    parser.add_argument(
+        "--sqlite",
+        metavar="FILE",
+        help="also export the catalog to an SQLite database.",
+    )
+    parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=0,
+        help="number of processes parsing recipes, 0 for one per CPU (default: %(default)s).",
+    )
+    parser.add_argument(
+        "--no-update",
+        action="store_true",
+        help="query the existing catalog without checking the recipes for changes.",
+    )
+    parser.add_argument(
+        "--option",
+        metavar="REGEX",
+        help="list the recipes with an option matching REGEX, e.g. 'simd|sse|avx'.",
+    )
+    parser.add_argument(
+        "--requires",
+        metavar="REGEX",
+        help="list the recipes requiring a reference matching REGEX, e.g. '^zlib/'.",
+    )
+    parser.add_argument(
+        "--variable",
+        metavar="REGEX",
+        help="list the recipes setting a toolchain variable matching REGEX.",
+    )
+    args = parser.parse_args()
+
+    catalog = read_catalog(args.catalog)
+    if not args.no_update:
+        changed = update_catalog(catalog, args.recipes, jobs=args.jobs or None)
+        if changed:
+            write_catalog(catalog, args.catalog)
+        errors = [key for key, info in catalog["recipes"].items() if info["error"]]
+        print(f"{len(catalog['recipes'])} recipes in {args.catalog}, {changed} updated, {len(errors)} with errors",
+              file=sys.stderr)
+    elif not catalog:
+        parser.error(f"{args.catalog} does not exist")
+    if args.sqlite:
+        write_sqlite(catalog, args.sqlite)
+
+    if args.option or args.requires or args.variable:
+        for key, found in query(catalog, args.option, args.requires, args.variable).items():
+            print(f"{key}: {', '.join(found)}")
+
+
+if __name__ == "__main__":
+    main()
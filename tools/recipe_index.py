@@ -0,0 +1,198 @@
+import argparse
+import hashlib
+import os
+import subprocess
+import sys
+from collections import namedtuple
+
+import yaml
+
+try:
+    from yaml import CBaseLoader as BaseLoader
+except ImportError:
+    from yaml import BaseLoader
+
+
+IndexEntry = namedtuple("IndexEntry", ["name", "version", "folder", "conandata_sha"])
+
+
+def git_blob_sha(path):
+    """Hash a file the way `git hash-object` does, or return '-' if it does not exist.
+
+    Using git's blob id lets the index be compared against `git ls-tree` output directly.
+    """
+    try:
+        with open(path, "rb") as f:
+            content = f.read()
+    except FileNotFoundError:
+        return "-"
+    return hashlib.sha1(b"blob %d\0" % len(content) + content).hexdigest()
+
+
+def parse_entries(name, config, conandata_sha):
+    """Index every version listed in the content of a `config.yml`.
+
+    All values are loaded as strings (`BaseLoader`), so versions like `1.10` are not
+    turned into floats. `conandata_sha` is called once per folder.
+    """
+    config = yaml.load(config, Loader=BaseLoader)
+    folder_shas = {}
+    entries = []
+    for version, info in (config or {}).get("versions", {}).items():
+        folder = info["folder"]
+        if folder not in folder_shas:
+            folder_shas[folder] = conandata_sha(folder)
+        entries.append(IndexEntry(name, version, folder, folder_shas[folder]))
+    return entries
+
+
+def recipe_entries(recipes_dir, name):
+    """Index every version listed in `recipes/<name>/config.yml` on disk."""
+    recipe_dir = os.path.join(recipes_dir, name)
+    try:
+        with open(os.path.join(recipe_dir, "config.yml"), encoding="utf-8") as f:
+            config = f.read()
+    except FileNotFoundError:
+        return []
+    return parse_entries(name, config, lambda folder: git_blob_sha(os.path.join(recipe_dir, folder, "conandata.yml")))
+
+
+def build_index(recipes_dir):
+    """Walk `recipes_dir` once and index every recipe version, sorted by name and version."""
+    entries = []
+    with os.scandir(recipes_dir) as it:
+        for entry in it:
+            if entry.is_dir():
+                entries.extend(recipe_entries(recipes_dir, entry.name))
+    return sorted(entries)
+
+
+def _git(recipes_dir, *args, **kwargs):
+    return subprocess.run(["git", "-C", recipes_dir, *args], check=True, capture_output=True, **kwargs).stdout
+
+
+def changed_recipes(recipes_dir, base, head=None):
+    """Names of the recipes with any file changed between `base` and `head`.
+
+    Without `head`, `base` is compared against the working tree, untracked files included.
+    """
+    revisions = [base, head] if head else [base]
+    output = _git(recipes_dir, "diff", "--name-only", "--no-renames", "--relative", *revisions, "--", ".", text=True)
+    if not head:
+        output += _git(recipes_dir, "ls-files", "--others", "--exclude-standard", "--", ".", text=True)
+    return {line.split("/", 1)[0] for line in output.splitlines() if "/" in line}
+
+
+def revision_entries(recipes_dir, head, names):
+    """Index the given recipes as they are in revision `head`, without checking it out.
+
+    Blob ids of the conandata.yml files come from one `git ls-tree` call and the config.yml
+    contents from one `git cat-file --batch` process, whatever the number of recipes.
+    """
+    if not names:
+        return []
+    blobs = {}
+    tree = _git(recipes_dir, "ls-tree", "-r", head, "--", *sorted(names), text=True)
+    for line in tree.splitlines():
+        info, path = line.split("\t", 1)
+        blobs[path] = info.split()[2]
+
+    configs = [f"{name}/config.yml" for name in sorted(names) if f"{name}/config.yml" in blobs]
+    batch = _git(recipes_dir, "cat-file", "--batch", input="".join(f"{blobs[c]}\n" for c in configs).encode())
+    entries = []
+    offset = 0
+    for config in configs:
+        header_end = batch.index(b"\n", offset)
+        size = int(batch[offset:header_end].split()[2])
+        content = batch[header_end + 1:header_end + 1 + size].decode("utf-8")
+        offset = header_end + 1 + size + 1
+        name = config.split("/", 1)[0]
+        entries.extend(parse_entries(name, content, lambda folder: blobs.get(f"{name}/{folder}/conandata.yml", "-")))
+    return entries
+
+
+def update_index(entries, recipes_dir, base, head=None):
+    """Patch an index built at `base` so that it matches `head` (or the working tree).
+
+    Only the recipes touched by `git diff base head` are parsed again.
+    """
+    names = changed_recipes(recipes_dir, base, head)
+    if head:
+        updated = revision_entries(recipes_dir, head, names)
+    else:
+        updated = [e for name in names for e in recipe_entries(recipes_dir, name)]
+    return sorted([e for e in entries if e.name not in names] + updated)
+
+
+def write_index(entries, f, refs_only=False):
+    """Write the index as tab-separated lines, or as '<name>/<version>' references.
+
+    References are sorted as plain strings, i.e. in the order `LC_ALL=C sort` expects, so
+    two reference lists can be compared with `comm` directly.
+    """
+    if refs_only:
+        for ref in sorted(f"{entry.name}/{entry.version}" for entry in entries):
+            f.write(f"{ref}\n")
+    else:
+        for entry in entries:
+            f.write("\t".join(entry) + "\n")
+
+
+def read_index(f):
+    return [IndexEntry(*line.rstrip("\n").split("\t")) for line in f if line.strip()]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Build a sorted index of every recipe version listed in 'recipes/*/config.yml'."
+    )
+    parser.add_argument(
+        "recipes",
+        nargs="?",
+        default="recipes",
+        help="path to the recipes folder (default: %(default)s).",
+    )
+    parser.add_argument(
+        "-o", "--output",
+        help="file to write the index to (default: stdout).",
+    )
+    parser.add_argument(
+        "--refs",
+        action="store_true",
+        help="only write '<name>/<version>' lines, suitable for 'comm'.",
+    )
+    parser.add_argument(
+        "--update",
+        metavar="INDEX",
+        help="incrementally update an existing index built at --base instead of rescanning all recipes. "
+             "The index is rewritten in place unless --output is given, so --refs requires --output.",
+    )
+    parser.add_argument(
+        "--base",
+        help="git revision the index passed to --update was built from.",
+    )
+    parser.add_argument(
+        "--head",
+        help="git revision to update the index to (default: the working tree).",
+    )
+    args = parser.parse_args()
+
+    if args.update:
+        if not args.base:
+            parser.error("--update requires --base")
+        if args.refs and not args.output:
+            parser.error("--update with --refs requires --output, the index cannot be rewritten as references")
+        with open(args.update, encoding="utf-8") as f:
+            entries = update_index(read_index(f), args.recipes, args.base, args.head)
+        args.output = args.output or args.update
+    else:
+        entries = build_index(args.recipes)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            write_index(entries, f, refs_only=args.refs)
+    else:
+        write_index(entries, sys.stdout, refs_only=args.refs)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,228 @@
+"""Measure how long every recipe takes to load, without building anything.
+
+Each `recipes/<name>/<folder>/conanfile.py` is imported and instantiated by Conan's own
+loader, including `init()`, `set_name()` and `set_version()`, the way graph resolution does
+it. Every load runs in a fresh worker process, so module-level caches of one recipe do not
+hide the cost of another, and nothing is fetched from remotes.
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    from .recipe_index import recipe_entries
+except ImportError:
+    # Run as a script, e.g. python tools/recipe_load_benchmark.py
+    from recipe_index import recipe_entries
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def _peak_rss_kib():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # bytes on macOS, KiB everywhere else
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def _conanfile_loader():
+    try:
+        from conan.internal.loader import ConanFileLoader
+    except ImportError:
+        from conans.client.loader import ConanFileLoader
+    return ConanFileLoader(pyreq_loader=None)
+
+
+def find_recipes(recipes_dir, names=None):
+    """(name, folder, version) of every recipe folder, with one version from config.yml to load it with."""
+    recipes = []
+    for name in sorted(names or os.listdir(recipes_dir)):
+        recipe_dir = os.path.join(recipes_dir, name)
+        if not os.path.isdir(recipe_dir):
+            continue
+        versions = {}
+        for entry in recipe_entries(recipes_dir, name):
+            versions.setdefault(entry.folder, entry.version)
+        for folder in sorted(os.listdir(recipe_dir)):
+            if os.path.isfile(os.path.join(recipe_dir, folder, "conanfile.py")):
+                recipes.append((name, folder, versions.get(folder)))
+    return recipes
+
+
+def load_recipe(recipes_dir, name, folder, version):
+    """Load one recipe and return its wall time in ms and the peak RSS it added in KiB."""
+    loader = _conanfile_loader()
+    path = os.path.abspath(os.path.join(recipes_dir, name, folder, "conanfile.py"))
+    rss_before = _peak_rss_kib()
+    error = None
+    start = time.perf_counter()
+    try:
+        loader.load_named(path, name, version, None, None)
+    except Exception as e:
+        # Conan wraps the traceback, its last line holds the actual error
+        error = str(e).strip().splitlines()[-1].strip() if str(e).strip() else type(e).__name__
+    wall_ms = (time.perf_counter() - start) * 1000
+    rss_after = _peak_rss_kib()
+    return {
+        "wall_ms": round(wall_ms, 3),
+        "peak_kib": rss_after - rss_before if rss_before is not None else None,
+        "error": error,
+    }
+
+
+def run_benchmark(recipes_dir, recipes, jobs=None, repeat=1):
+    """Load each recipe `repeat` times and keep the fastest run."""
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context("forkserver")
+        # Conan is imported once by the fork server, not by every worker
+        context.set_forkserver_preload([type(_conanfile_loader()).__module__])
+    else:
+        context = multiprocessing.get_context("spawn")
+    results = {}
+    with ProcessPoolExecutor(max_workers=jobs, mp_context=context, max_tasks_per_child=1) as executor:
+        futures = [(f"{name}/{folder}", executor.submit(load_recipe, recipes_dir, name, folder, version))
+                   for name, folder, version in recipes for _ in range(repeat)]
+        for key, future in futures:
+            result = future.result()
+            if key not in results or result["wall_ms"] < results[key]["wall_ms"]:
+                results[key] = result
+    return results
+
+
+def compare(report, baseline, threshold, min_delta_ms, min_delta_kib):
+    """Regressions of `report` against `baseline`, as human readable lines.
+
+    A recipe regresses when it is both `threshold` times slower (or bigger) and slower by
+    more than the absolute minimum, so that noise on fast recipes is not reported.
+    """
+    regressions = []
+    for key, result in sorted(report["recipes"].items()):
+        base = baseline["recipes"].get(key)
+        if base is None:
+            continue
+        if result["error"] and not base["error"]:
+            regressions.append(f"{key}: fails to load: {result['error']}")
+            continue
+        delta = result["wall_ms"] - base["wall_ms"]
+        if delta > min_delta_ms and result["wall_ms"] > base["wall_ms"] * (1 + threshold):
+            regressions.append(f"{key}: {base['wall_ms']:.1f} ms -> {result['wall_ms']:.1f} ms")
+        if result["peak_kib"] is not None and base["peak_kib"] is not None:
+            delta = result["peak_kib"] - base["peak_kib"]
+            if delta > min_delta_kib and result["peak_kib"] > base["peak_kib"] * (1 + threshold):
+                regressions.append(f"{key}: {base['peak_kib']} KiB -> {result['peak_kib']} KiB")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark the load time and memory of every 'recipes/*/*/conanfile.py', without building."
+    )
+    parser.add_argument(
+        "names",
+        nargs="*",
+        metavar="name",
+        help="recipes to benchmark (default: all of them).",
+    )
+    parser.add_argument(
+        "--recipes",
+        default="recipes",
+        help="path to the recipes folder (default: %(default)s).",
+    )
+    parser.add_argument(
+        "-o", "--output",
+        help="file to write the JSON report to.",
+    )
+    parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=1,
+        help="number of recipes loaded concurrently, 0 for one per CPU (default: %(default)s). "
+             "Concurrent loads compete for CPU and disk, keep 1 for stable timings.",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=1,
+        help="load each recipe N times and keep the fastest run (default: %(default)s).",
+    )
+    parser.add_argument(
+        "--baseline",
+        help="JSON report of a previous run; exit with an error if any recipe regressed.",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.5,
+        help="relative increase over the baseline reported as a regression (default: %(default)s).",
+    )
+    parser.add_argument(
+        "--min-delta-ms",
+        type=float,
+        default=10,
+        help="ignore load time increases smaller than this (default: %(default)s).",
+    )
+    parser.add_argument(
+        "--min-delta-kib",
+        type=int,
+        default=2048,
+        help="ignore peak memory increases smaller than this (default: %(default)s).",
+    )
+    parser.add_argument(
+        "--slowest",
+        type=int,
+        default=10,
+        help="number of slowest recipes to print (default: %(default)s).",
+    )
+    args = parser.parse_args()
+
+    recipes = find_recipes(args.recipes, args.names)
+    if not recipes:
+        parser.error("no recipes found")
+    start = time.perf_counter()
+    results = run_benchmark(args.recipes, recipes, jobs=args.jobs or None, repeat=args.repeat)
+    elapsed = time.perf_counter() - start
+
+    from conan import __version__ as conan_version
+    report = {
+        "conan_version": conan_version,
+        "python_version": platform.python_version(),
+        "platform": platform.platform(),
+        "recipes": results,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+            f.write("\n")
+
+    errors = {key: result for key, result in results.items() if result["error"]}
+    total_ms = sum(result["wall_ms"] for result in results.values())
+    print(f"Loaded {len(results) - len(errors)} recipes ({len(errors)} failed) in {elapsed:.1f} s, "
+          f"{total_ms:.0f} ms spent loading", file=sys.stderr)
+    slowest = sorted(results.items(), key=lambda item: item[1]["wall_ms"], reverse=True)[:args.slowest]
+    for key, result in slowest:
+        peak = f"{result['peak_kib']:>8} KiB" if result["peak_kib"] is not None else ""
+        print(f"  {result['wall_ms']:8.1f} ms {peak}  {key}", file=sys.stderr)
+    for key, result in sorted(errors.items()):
+        print(f"::warning file=recipes/{key}/conanfile.py,title=recipe load failed::{result['error']}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(report, baseline, args.threshold, args.min_delta_ms, args.min_delta_kib)
+        for line in regressions:
+            print(f"::error title=recipe load regression::{line}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
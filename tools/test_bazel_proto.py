@@ -0,0 +1,184 @@
+"""Tests of the BUILD.bazel parser shared by the googleapis and grpc-proto recipes.
+
+Run with `python -m unittest tools.test_bazel_proto` or `python -m pytest tools` from the root of the repository.
+"""
+import importlib.util
+import os
+import tempfile
+import textwrap
+import unittest
+from pathlib import Path
+
+RECIPES_DIR = Path(__file__).resolve().parent.parent / "recipes"
+REFERENCE = RECIPES_DIR / "googleapis" / "all" / "bazel_proto.py"
+COPIES = [RECIPES_DIR / "grpc-proto" / "all" / "bazel_proto.py"]
+
+
+def _load(path):
+    spec = importlib.util.spec_from_file_location("bazel_proto", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+bazel_proto = _load(REFERENCE)
+
+
+class CopiesTest(unittest.TestCase):
+    def test_copies_are_identical(self):
+        reference = REFERENCE.read_bytes()
+        for copy in COPIES:
+            self.assertEqual(copy.read_bytes(), reference, f"{copy} differs from {REFERENCE}, copy it over")
+
+
+class ParseBuildFileTest(unittest.TestCase):
+    def test_multi_line_srcs_and_deps(self):
+        rules = bazel_proto.parse_build_file(textwrap.dedent("""\
+            load("@rules_proto//proto:defs.bzl", "proto_library")
+
+            proto_library(
+                name = "api_proto",
+                srcs = [
+                    "annotations.proto",  # trailing comment
+                    # a comment line
+                    "http.proto",
+                ],
+                deps = [
+                    ":client_proto",
+                    "@com_google_protobuf//:descriptor_proto",
+                ],
+                visibility = ["//visibility:public"],
+            )
+
+            cc_proto_library(
+                name = "api_cc_proto",
+                deps = [":api_proto"],
+            )
+        """))
+        self.assertEqual(rules, [
+            {"kind": "proto_library", "name": "api_proto", "srcs": ["annotations.proto", "http.proto"],
+             "deps": [":client_proto", "@com_google_protobuf//:descriptor_proto"]},
+            {"kind": "cc_proto_library", "name": "api_cc_proto", "srcs": [], "deps": [":api_proto"]},
+        ])
+
+    def test_variables_and_concatenation(self):
+        rules = bazel_proto.parse_build_file(textwrap.dedent("""\
+            _PROTO_SUBPACKAGE_DEPS = [
+                "//google/api:annotations_proto",
+            ]
+            _COMMON = _PROTO_SUBPACKAGE_DEPS + ["//google/rpc:status_proto"]
+            _UNUSED = glob(["*.txt"])
+
+            proto_library(
+                name = "a_proto",
+                srcs = ["a.proto"],
+                deps = [":b_proto"] + _COMMON,
+            )
+        """))
+        self.assertEqual(rules[0]["deps"], [":b_proto", "//google/api:annotations_proto", "//google/rpc:status_proto"])
+
+    def test_select_default_branch(self):
+        rules = bazel_proto.parse_build_file(textwrap.dedent("""\
+            proto_library(
+                name = "a_proto",
+                deps = [":b_proto"] + select({
+                    "//:windows": [":win_proto"],
+                    "//conditions:default": [":posix_proto"],
+                }),
+            )
+        """))
+        self.assertEqual(rules[0]["deps"], [":b_proto", ":posix_proto"])
+
+    def test_select_without_default_uses_all_branches(self):
+        rules = bazel_proto.parse_build_file(textwrap.dedent("""\
+            proto_library(
+                name = "a_proto",
+                deps = select({
+                    "//:windows": [":win_proto"],
+                    "//:linux": [":linux_proto"],
+                }),
+            )
+        """))
+        self.assertEqual(rules[0]["deps"], [":win_proto", ":linux_proto"])
+
+    def test_other_rules_are_ignored(self):
+        rules = bazel_proto.parse_build_file('cc_library(name = "lib", srcs = glob(["*.cc"]))\n')
+        self.assertEqual(rules, [])
+
+    def test_error_raises_without_callback(self):
+        content = 'proto_library(name = "a_proto", deps = [":b"] + UNKNOWN)\n'
+        with self.assertRaisesRegex(bazel_proto.BuildFileError, "BUILD.bazel:1: unknown variable 'UNKNOWN'"):
+            bazel_proto.parse_build_file(content)
+        with self.assertRaises(bazel_proto.BuildFileError):
+            bazel_proto.parse_build_file("proto_library(\n")
+
+    def test_error_callback_skips_the_rule(self):
+        errors = []
+        rules = bazel_proto.parse_build_file(textwrap.dedent("""\
+            proto_library(name = "bad_proto", deps = [":b"] + UNKNOWN)
+            proto_library(srcs = ["nameless.proto"])
+            proto_library(name = "good_proto", srcs = ["good.proto"])
+        """), error=errors.append)
+        self.assertEqual([rule["name"] for rule in rules], ["good_proto"])
+        self.assertEqual(len(errors), 2)
+        self.assertIn("unknown variable 'UNKNOWN'", errors[0])
+        self.assertIn("without a name", errors[1])
+
+    def test_syntax_error_callback(self):
+        errors = []
+        self.assertEqual(bazel_proto.parse_build_file("proto_library(\n", error=errors.append), [])
+        self.assertEqual(len(errors), 1)
+
+
+class ParseCacheTest(unittest.TestCase):
+    def setUp(self):
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.tmpdir = self._tmpdir.name
+        self.cache_file = os.path.join(self.tmpdir, "cache.json")
+        self.build_file = os.path.join(self.tmpdir, "BUILD.bazel")
+
+    def tearDown(self):
+        self._tmpdir.cleanup()
+
+    def _write(self, content, filename=None):
+        with open(filename or self.build_file, "w", encoding="utf-8") as f:
+            f.write(content)
+
+    def test_hit_and_invalidation(self):
+        self._write('proto_library(name = "a_proto", srcs = ["a.proto"])\n')
+        cache = bazel_proto.ParseCache(self.cache_file)
+        self.assertEqual(cache.rules(self.build_file)[0]["name"], "a_proto")
+        cache.save()
+
+        # Same content, even at another location: a hit, restored from the file
+        other_file = os.path.join(self.tmpdir, "other.bazel")
+        self._write('proto_library(name = "a_proto", srcs = ["a.proto"])\n', other_file)
+        cache = bazel_proto.ParseCache(self.cache_file)
+        self.assertEqual(cache.rules(other_file)[0]["name"], "a_proto")
+        self.assertEqual((cache.hits, cache.misses), (1, 0))
+
+        # Changed content: parsed again
+        self._write('proto_library(name = "b_proto", srcs = ["b.proto"])\n')
+        self.assertEqual(cache.rules(self.build_file)[0]["name"], "b_proto")
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_files_with_errors_are_not_cached(self):
+        self._write('proto_library(name = "a_proto", deps = UNKNOWN)\nproto_library(name = "b_proto")\n')
+        for _ in range(2):
+            errors = []
+            cache = bazel_proto.ParseCache(self.cache_file)
+            self.assertEqual([rule["name"] for rule in cache.rules(self.build_file, errors.append)], ["b_proto"])
+            cache.save()
+            self.assertEqual(cache.misses, 1)
+            self.assertEqual(len(errors), 1)
+
+    def test_corrupted_cache_file_is_ignored(self):
+        self._write('proto_library(name = "a_proto")\n')
+        self._write("{not json", self.cache_file)
+        cache = bazel_proto.ParseCache(self.cache_file)
+        self.assertEqual(cache.rules(self.build_file)[0]["name"], "a_proto")
+        self.assertEqual(cache.misses, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()